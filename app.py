@@ -13,10 +13,15 @@ from typing import Any
 import flaskcode
 from flask import Flask, abort, render_template, request, session
 
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional; responses are sent uncompressed without it
+    Compress = None
+
 from blueprints.editor import editor_bp
 from blueprints.envs import envs_bp
 from blueprints.jobs import jobs_bp
-from blueprints.modules import _preload_modules_cache, modules_bp
+from blueprints.modules import _keep_modules_cache_warm, modules_bp
 from blueprints.projects import projects_bp
 from blueprints.settings import settings_bp
 from utils import CustomJsonProvider, load_settings, safe_code_editor_path
@@ -182,12 +187,12 @@ def _start_background_threads() -> None:
     )
     quota_thread.start()
 
-    modules_preload_thread = threading.Thread(
-        target=_preload_modules_cache,
-        name='module-cache-preload',
+    modules_warm_thread = threading.Thread(
+        target=_keep_modules_cache_warm,
+        name='module-cache-warm',
         daemon=True,
     )
-    modules_preload_thread.start()
+    modules_warm_thread.start()
 
 
 def validate_csrf_token() -> None:
@@ -334,7 +339,7 @@ def _parse_disk_quota() -> dict[str, object] | None:
 
 def index() -> str:
     """Render the home page with disk quota information."""
-    logger.info("Home page accessed")
+    logger.debug("Home page accessed")
 
     disk_quota = _parse_disk_quota()
     username = os.environ.get("USER", "user")
@@ -363,6 +368,11 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
         application.config['FLASKCODE_RESOURCE_BASEPATH']
     )
     application.config.setdefault('START_BACKGROUND_THREADS', True)
+    # Used only when flask-compress is installed. /modules/list sets its
+    # own precompressed Content-Encoding, which Compress leaves alone.
+    application.config.setdefault('COMPRESS_ALGORITHM', ['br', 'gzip'])
+    application.config.setdefault('COMPRESS_MIN_SIZE', 500)
+    application.config.setdefault('COMPRESS_STREAMS', False)
     if test_config is not None:
         application.config.update(test_config)
     application.config.update(
@@ -373,6 +383,9 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
 
     _configure_logging()
 
+    if Compress is not None:
+        Compress(application)
+
     application.register_blueprint(flaskcode.blueprint, url_prefix='/flaskcode')
     application.register_blueprint(modules_bp)
     application.register_blueprint(jobs_bp)
@@ -5,17 +5,31 @@ import re
 import subprocess
 import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from flask import Blueprint, jsonify, render_template, request
 
-from utils import find_binary
+from utils import (
+    atomic_write_bytes,
+    find_binary,
+    json_dumps_bytes,
+    json_loads,
+    read_file_bytes,
+)
 
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/jobs')
 logger = logging.getLogger(__name__)
 PARTITION_METADATA_FILE = Path('config/partition_metadata.json')
 SEFF_CACHE_FILE = Path('logs/seff_cache.json')
+# Seconds the parsed partition metadata is trusted before re-checking mtime
+PARTITION_METADATA_TTL = 300
+
+_partition_metadata: dict[str, Any] | None = None
+_partition_metadata_key: tuple[str, int, int] | None = None
+_partition_metadata_checked = 0.0
+_seff_cache: tuple[tuple[str, int, int], dict[str, dict[str, Any]]] | None = None
 
 SINFO_PATHS = [
     '/cm/shared/apps/slurm/18.08.9/bin/sinfo',
@@ -156,7 +170,7 @@ def _parse_squeue_output(output: str) -> list[dict[str, str]]:
             for field in line.split(SQUEUE_FIELD_DELIMITER, 6)
         ]
         if len(fields) < 6:
-            logger.debug(f"Skipping malformed squeue row: {raw_line}")
+            logger.debug("Skipping malformed squeue row: %s", raw_line)
             continue
 
         job_id, name, state, partition, time_used, time_limit = fields[:6]
@@ -175,24 +189,44 @@ def _parse_squeue_output(output: str) -> list[dict[str, str]]:
 
 
 def _load_seff_cache() -> dict[str, dict[str, Any]]:
-    """Load seff cache from file.
-    
+    """Load seff cache from file, reusing the last parse while unchanged.
+
+    The parse is keyed by path, mtime, and size, so only the first detail
+    view after a seff result is saved re-reads the file.
+
     Returns:
-        Dictionary mapping job_id to cached seff data
+        Dictionary mapping job_id to cached seff data. It is shared between
+        calls; copy it before modifying.
     """
-    if not SEFF_CACHE_FILE.exists():
-        return {}
-    
+    global _seff_cache
+
     try:
-        with SEFF_CACHE_FILE.open('r', encoding='utf-8') as f:
-            cache = json.load(f)
-        if isinstance(cache, dict):
-            return cache
+        stat_result = SEFF_CACHE_FILE.stat()
+    except FileNotFoundError:
         return {}
+    except OSError as e:
+        logger.warning(f"Error loading seff cache: {e}")
+        return {}
+
+    file_key = (
+        str(SEFF_CACHE_FILE),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    )
+    if _seff_cache is not None and _seff_cache[0] == file_key:
+        return _seff_cache[1]
+
+    try:
+        cache = json_loads(read_file_bytes(SEFF_CACHE_FILE))
     except (OSError, json.JSONDecodeError) as e:
         logger.warning(f"Error loading seff cache: {e}")
         return {}
 
+    if not isinstance(cache, dict):
+        cache = {}
+    _seff_cache = (file_key, cache)
+    return cache
+
 
 def _save_seff_cache(cache: dict[str, dict[str, Any]]) -> None:
     """Save seff cache to file.
@@ -202,8 +236,7 @@ def _save_seff_cache(cache: dict[str, dict[str, Any]]) -> None:
     """
     try:
         SEFF_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with SEFF_CACHE_FILE.open('w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        atomic_write_bytes(SEFF_CACHE_FILE, json_dumps_bytes(cache))
     except (OSError, TypeError) as e:
         logger.warning(f"Error saving seff cache: {e}")
 
@@ -214,7 +247,7 @@ def _cache_seff_result(
     error: str | None,
 ) -> None:
     """Persist one seff result or error for later detail views."""
-    cache = _load_seff_cache()
+    cache = dict(_load_seff_cache())
     cache[job_id] = {
         'output': output,
         'error': error,
@@ -253,7 +286,7 @@ def _call_seff(
         
         if job_id in cache:
             cached_data = cache[job_id]
-            logger.debug(f"Using cached seff data for job {job_id}")
+            logger.debug("Using cached seff data for job %s", job_id)
             return cached_data.get('output'), cached_data.get('error')
     
     # Not in cache or force refresh - call seff
@@ -319,14 +352,44 @@ def _call_sacct(user: str | None = None) -> tuple[str | None, str | None]:
 
 
 def _load_partition_metadata() -> dict[str, Any]:
-    """Load partition metadata from JSON file."""
-    if not PARTITION_METADATA_FILE.exists():
-        return {}
+    """Load partition metadata, keeping the parsed file in process memory.
+
+    Within PARTITION_METADATA_TTL the cached copy is returned without
+    touching disk; after that one stat decides whether to re-parse.
+    """
+    global _partition_metadata, _partition_metadata_key
+    global _partition_metadata_checked
+
+    now = time.monotonic()
+    if (
+        _partition_metadata is not None
+        and now - _partition_metadata_checked < PARTITION_METADATA_TTL
+    ):
+        return _partition_metadata
+
     try:
-        with PARTITION_METADATA_FILE.open('r', encoding='utf-8') as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {}
+        stat_result = PARTITION_METADATA_FILE.stat()
+    except OSError:
+        file_key = None
+    else:
+        file_key = (
+            str(PARTITION_METADATA_FILE),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+
+    if _partition_metadata is None or file_key != _partition_metadata_key:
+        metadata: dict[str, Any] = {}
+        if file_key is not None:
+            try:
+                metadata = json_loads(read_file_bytes(PARTITION_METADATA_FILE))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Error loading partition metadata: {e}")
+        _partition_metadata = metadata
+        _partition_metadata_key = file_key
+
+    _partition_metadata_checked = now
+    return _partition_metadata
 
 
 def _parse_sinfo_output(output: str) -> list[dict[str, Any]]:
@@ -431,14 +494,8 @@ def _generate_partition_reference_data(
     partitions: list[dict[str, Any]],
 ) -> dict[str, list[dict[str, Any]]]:
     """Generate structured partition reference data grouped by category."""
-    if not PARTITION_METADATA_FILE.exists():
-        return {}
-    
-    try:
-        with PARTITION_METADATA_FILE.open('r', encoding='utf-8') as f:
-            metadata = json.load(f)
-    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
-        logger.warning(f"Error loading partition metadata: {e}")
+    metadata = _load_partition_metadata()
+    if not metadata:
         return {}
     
     # Create a dict mapping partition names to partition data
@@ -464,7 +521,7 @@ def _generate_partition_reference_data(
     
     # Sort partitions within each category
     for category in categories:
-        categories[category].sort(key=lambda x: x['name'])
+        categories[category].sort(key=itemgetter('name'))
     
     return categories
 
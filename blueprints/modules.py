@@ -1,8 +1,12 @@
 import fcntl
+import gzip
+import hashlib
 import json
 import logging
 import os
+import pickle
 import re
+import sys
 import threading
 import time
 from collections.abc import Iterator
@@ -11,22 +15,70 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from flask import Blueprint, Response, jsonify, render_template
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+)
+
+from utils import (
+    atomic_write_bytes,
+    json_dumps_bytes,
+    json_loads,
+    read_file_bytes,
+    read_file_text,
+)
 
 modules_bp = Blueprint('modules', __name__, url_prefix='/modules')
 logger = logging.getLogger(__name__)
 
 CATEGORIES_FILE = Path('config/module_categories.json')
 MODULE_REFRESH_LOCK_FILE = Path('logs/modules_refresh.lock')
+MODULES_SNAPSHOT_FILE = Path('logs/modules_spider_snapshot.pickle')
+MODULES_SNAPSHOT_VERSION = 1
 
 SPIDER_CACHE_DEFAULT = Path('/share/apps/sysCacheDir/spiderT.lua')
 SPIDER_CACHE_ENV_VAR = 'OOD_HPC_DASH_SPIDER_CACHE'
 
-_modules_cache: list[dict[str, Any]] | None = None
-_modules_cache_timestamp: float | None = None
-
-_streaming_lock = threading.Lock()
-_streaming_in_progress = False
+# Cached module data is served stale past this age while a background
+# thread reloads it; reload attempts are spaced at least this far apart.
+MODULES_CACHE_TTL = 300
+MODULES_REVALIDATE_INTERVAL = 60
+# The startup thread revalidates this often so the cache never goes stale
+MODULES_KEEP_WARM_INTERVAL = MODULES_CACHE_TTL - 30
+# With no cache at all, requests wait up to this long on an in-flight load
+MODULES_COLD_START_WAIT = 15
+# The page's ready stream can hold a connection open longer than a request
+MODULES_READY_STREAM_WAIT = 60
+# Encoded list bodies are gzipped once per store, not per request
+MODULES_GZIP_LEVEL = 6
+
+# (records, grouping, timestamp, list_body, columns_body, list_gzip,
+# columns_gzip, digest, modified): published with one assignment and read
+# once per request, so a response never pairs records or a body with another
+# store's grouping, ETag or timestamps
+_modules_snapshot: tuple[
+    list[dict[str, Any]],
+    tuple[dict[str, list[dict[str, Any]]], list[str]],
+    float,
+    bytes,
+    bytes,
+    bytes,
+    bytes,
+    str,
+    float,
+] | None = None
+_modules_source_key: tuple[object, ...] | None = None
+_categories_file_cache: tuple[tuple[str, int, int], object] | None = None
+
+# Held for the duration of a preload or SSE refresh in this process; the
+# flock in _module_refresh_file_lock covers other Passenger workers.
+_module_refresh_lock = threading.Lock()
+_modules_cache_ready = threading.Event()
+_last_revalidation_start: float | None = None
 
 
 @contextmanager
@@ -65,6 +117,29 @@ def _get_spider_cache_path() -> Path | None:
     return None
 
 
+# One regex match consumes a whole `key = scalar` entry of a spiderT table;
+# the cache can be megabytes and per-character Python loops dominated
+# preload time.
+_LUA_QUOTED = r'"[^"\\]*(?:\\.[^"\\]*)*"' "|" r"'[^'\\]*(?:\\.[^'\\]*)*'"
+_LUA_ENTRY = re.compile(
+    r'''
+    [ \t\n\r,]*(?P<start>)
+    (?:
+        \[(?P<quoted_key>''' + _LUA_QUOTED + r''')[\] \t=]*
+      | (?P<bare_key>[^\W\d]\w*)[ \t=]*
+    )?
+    (?:
+        (?P<string>''' + _LUA_QUOTED + r''')
+      | (?P<true>true)
+      | (?P<false>false)
+      | (?P<number>[-\d][\d.eE+-]*)
+    )?
+    ''',
+    re.VERBOSE | re.DOTALL,
+)
+_LUA_KEY_SUFFIX = re.compile(r'[\] \t=]*')
+
+
 def _parse_lua_string(text: str, pos: int) -> tuple[str, int]:
     """Parse a quoted Lua string starting at pos, return (value, new_pos)."""
     quote = text[pos]
@@ -88,80 +163,84 @@ def _parse_lua_table(text: str, pos: int) -> tuple[dict | list, int]:
     and nested tables. Array-style tables (sequential integer keys) are
     returned as lists.
     """
+    text_length = len(text)
+    match_entry = _LUA_ENTRY.match
     pos += 1  # skip opening {
     result: dict[str, object] = {}
     array_items: list[object] = []
     has_string_keys = False
-    idx = 0
 
-    while pos < len(text):
-        # skip whitespace and commas
-        while pos < len(text) and text[pos] in ' \t\n\r,':
+    while pos < text_length:
+        entry = match_entry(text, pos)
+        pos = entry.start('start')
+
+        if pos >= text_length:
             pos += 1
+            break
 
-        if pos >= len(text) or text[pos] == '}':
+        char = text[pos]
+        if char == '}':
             pos += 1
             break
 
         # skip single-line comments
-        if text[pos:pos + 2] == '--':
+        if char == '-' and text.startswith('--', pos):
             nl = text.find('\n', pos)
-            pos = nl + 1 if nl != -1 else len(text)
+            pos = nl + 1 if nl != -1 else text_length
             continue
 
-        key: str | None = None
-
-        # ["string-key"] = value
-        if text[pos] == '[' and pos + 1 < len(text) and text[pos + 1] in '"\'':
-            key, pos = _parse_lua_string(text, pos + 1)
-            # skip ] =
-            while pos < len(text) and text[pos] in '] \t=':
-                pos += 1
+        _, quoted_key, key, string, true, false, number = entry.groups()
+        value: object
+        if quoted_key is not None:
+            key = quoted_key[1:-1]
             has_string_keys = True
-
-        # bare_key = value
-        elif text[pos].isalpha() or text[pos] == '_':
-            end = pos
-            while end < len(text) and (text[end].isalnum() or text[end] == '_'):
-                end += 1
-            key = text[pos:end]
-            pos = end
-            while pos < len(text) and text[pos] in ' \t=':
-                pos += 1
+        elif key is not None:
             has_string_keys = True
-
-        # parse value
-        if pos >= len(text):
-            break
-
-        value: object
-        if text[pos] == '{':
-            value, pos = _parse_lua_table(text, pos)
-        elif text[pos] in '"\'':
-            value, pos = _parse_lua_string(text, pos)
-        elif text[pos:pos + 4] == 'true':
-            value, pos = True, pos + 4
-        elif text[pos:pos + 5] == 'false':
-            value, pos = False, pos + 5
-        elif text[pos] == '-' or text[pos].isdigit():
-            end = pos + 1
-            while end < len(text) and (text[end].isdigit() or text[end] in '.eE+-'):
-                end += 1
+        elif (
+            char == '['
+            and pos + 1 < text_length
+            and text[pos + 1] in '"\''
+        ):
+            # Unterminated quoted key: fall back to the character scanner
+            key, pos = _parse_lua_string(text, pos + 1)
+            if pos < text_length:
+                pos = _LUA_KEY_SUFFIX.match(text, pos).end()
+            has_string_keys = True
+            string = true = false = number = None
+            entry = None
+
+        if string is not None:
+            value = string[1:-1]
+            pos = entry.end()
+        elif true is not None:
+            value, pos = True, entry.end()
+        elif false is not None:
+            value, pos = False, entry.end()
+        elif number is not None:
             try:
-                num_str = text[pos:end]
-                value = int(num_str) if '.' not in num_str else float(num_str)
+                value = int(number) if '.' not in number else float(number)
             except ValueError:
-                value = text[pos:end]
-            pos = end
+                value = number
+            pos = entry.end()
         else:
-            pos += 1
-            continue
+            if entry is not None:
+                pos = entry.end()
+            if pos >= text_length:
+                break
+
+            char = text[pos]
+            if char == '{':
+                value, pos = _parse_lua_table(text, pos)
+            elif char == '"' or char == "'":
+                value, pos = _parse_lua_string(text, pos)
+            else:
+                pos += 1
+                continue
 
         if key is not None:
             result[key] = value
         else:
             array_items.append(value)
-            idx += 1
 
     if not has_string_keys and array_items:
         return array_items, pos
@@ -175,15 +254,19 @@ def _parse_spider_cache(
 ) -> dict[str, dict[str, object]] | None:
     """Read spiderT.lua and convert it to the modules dict format.
 
-    Returns the same shape as _parse_module_spider_output:
+    Returns the shape shared by the snapshot, record builder, and SSE refresh:
     {family_name: {'versions': [str, ...], 'description': str}}
     """
     try:
-        raw = cache_path.read_text(encoding='utf-8', errors='replace')
+        raw = read_file_text(cache_path)
     except OSError as exc:
         logger.warning("Unable to read spider cache %s: %s", cache_path, exc)
         return None
 
+    if '\r' in raw:
+        # Match text-mode reads: normalize newlines before parsing strings
+        raw = raw.replace('\r\n', '\n').replace('\r', '\n')
+
     # Locate the spiderT table
     marker = 'spiderT = {'
     start = raw.find(marker)
@@ -279,6 +362,116 @@ def _parse_spider_cache(
     return modules
 
 
+def _read_categories_file() -> object:
+    """Parse module_categories.json, reusing the last parse while unchanged.
+
+    Categories and descriptions share this file, so building module records
+    would otherwise open and decode it twice. The parse is keyed by path,
+    mtime, and size so edits and description saves invalidate it.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    global _categories_file_cache
+
+    stat_result = CATEGORIES_FILE.stat()
+    file_key = (
+        str(CATEGORIES_FILE),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    )
+    if (
+        _categories_file_cache is not None
+        and _categories_file_cache[0] == file_key
+    ):
+        return _categories_file_cache[1]
+
+    data = json_loads(read_file_bytes(CATEGORIES_FILE))
+    _categories_file_cache = (file_key, data)
+    return data
+
+
+def _spider_cache_key(cache_path: Path) -> tuple[str, int, int]:
+    """Identify one version of the spider cache by path, mtime, and size."""
+    stat_result = cache_path.stat()
+    return str(cache_path), stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _load_modules_snapshot(
+    source_key: tuple[str, int, int],
+) -> dict[str, dict[str, object]] | None:
+    """Return parsed spider data saved for this spider cache, if current.
+
+    The snapshot starts with a one-byte format version followed by a
+    protocol 5 pickle, so format changes simply miss and re-parse.
+    """
+    try:
+        raw = read_file_bytes(MODULES_SNAPSHOT_FILE)
+    except OSError:
+        return None
+
+    if not raw or raw[0] != MODULES_SNAPSHOT_VERSION:
+        return None
+
+    try:
+        snapshot = pickle.loads(raw[1:])
+    except (pickle.UnpicklingError, EOFError, AttributeError,
+            ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable module snapshot: {e}")
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get('source') != source_key:
+        return None
+
+    modules = snapshot.get('modules')
+    return modules if isinstance(modules, dict) else None
+
+
+def _save_modules_snapshot(
+    source_key: tuple[str, int, int],
+    modules: dict[str, dict[str, object]],
+) -> None:
+    """Persist parsed spider data so worker restarts skip the Lua parse."""
+    payload = pickle.dumps(
+        {'source': source_key, 'modules': modules},
+        protocol=5,
+    )
+    try:
+        MODULES_SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            MODULES_SNAPSHOT_FILE,
+            bytes([MODULES_SNAPSHOT_VERSION]) + payload,
+        )
+    except OSError as e:
+        logger.warning(f"Unable to save module snapshot: {e}")
+
+
+def _read_spider_modules(
+    cache_path: Path,
+) -> dict[str, dict[str, object]] | None:
+    """Return parsed spider data, reusing the snapshot while it is current."""
+    try:
+        source_key = _spider_cache_key(cache_path)
+    except OSError as exc:
+        logger.warning("Unable to stat spider cache %s: %s", cache_path, exc)
+        return None
+
+    modules = _load_modules_snapshot(source_key)
+    if modules is not None:
+        logger.info(
+            "Loaded %d module families from snapshot of %s",
+            len(modules),
+            cache_path,
+        )
+        return modules
+
+    modules = _parse_spider_cache(cache_path)
+    if modules:
+        _save_modules_snapshot(source_key, modules)
+    return modules
+
+
 def _load_descriptions_cache() -> dict[str, str]:
     """Load module descriptions from module_categories.json.
 
@@ -289,14 +482,17 @@ def _load_descriptions_cache() -> dict[str, str]:
         return {}
 
     try:
-        with CATEGORIES_FILE.open('r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_categories_file()
         if isinstance(data, dict):
             # Check if descriptions key exists
             descriptions = data.get('descriptions', {})
             if isinstance(descriptions, dict):
-                logger.debug(f"Loaded {len(descriptions)} cached descriptions from module_categories.json")
-                return descriptions
+                logger.debug(
+                    "Loaded %d cached descriptions from module_categories.json",
+                    len(descriptions),
+                )
+                # Callers merge into this dict, so keep the shared parse intact
+                return dict(descriptions)
         return {}
     except (OSError, json.JSONDecodeError) as e:
         logger.warning(f"Error loading descriptions from module_categories.json: {e}")
@@ -312,12 +508,11 @@ def _save_descriptions_cache(cache: dict[str, str]) -> None:
     try:
         CATEGORIES_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load existing categories file
+        # Load existing categories file through the shared memoized parse
         existing_data = {}
         if CATEGORIES_FILE.exists():
             try:
-                with CATEGORIES_FILE.open('r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                existing_data = _read_categories_file()
             except (OSError, json.JSONDecodeError) as e:
                 logger.warning(f"Unable to read existing module categories: {e}")
 
@@ -331,18 +526,25 @@ def _save_descriptions_cache(cache: dict[str, str]) -> None:
         # Merge descriptions
         existing_descriptions = existing_data.get('descriptions', {})
         if isinstance(existing_descriptions, dict):
-            existing_descriptions.update(cache)
-            descriptions = existing_descriptions
+            # Merge into a copy; the parsed file is shared with other readers
+            descriptions = {**existing_descriptions, **cache}
         else:
             descriptions = cache
 
         # Combine categories and descriptions
         combined_data = {**categories, 'descriptions': descriptions}
 
-        # Save to file
-        with CATEGORIES_FILE.open('w', encoding='utf-8') as f:
-            json.dump(combined_data, f, indent=4, ensure_ascii=False)
-        logger.debug(f"Saved {len(descriptions)} descriptions to module_categories.json")
+        # Swap the file in whole; other workers read it while we write
+        atomic_write_bytes(
+            CATEGORIES_FILE,
+            json.dumps(combined_data, indent=4, ensure_ascii=False).encode(
+                'utf-8'
+            ),
+        )
+        logger.debug(
+            "Saved %d descriptions to module_categories.json",
+            len(descriptions),
+        )
     except (OSError, TypeError) as e:
         logger.warning(f"Error saving descriptions to module_categories.json: {e}")
 
@@ -352,12 +554,10 @@ def _module_base_name(family_name: str, versions: list[str]) -> str:
     if not versions:
         return family_name
 
-    parts = versions[0].split('/')
-    if len(parts) > 2:
-        return '/'.join(parts[:-1])
-    if len(parts) == 2:
-        return parts[0]
-    return family_name
+    # Everything before the last '/' (e.g. 'Python' for 'Python/3.11');
+    # rpartition avoids building and re-joining a split list per family.
+    base_name, separator, _ = versions[0].rpartition('/')
+    return base_name if separator else family_name
 
 
 def _module_record(
@@ -366,11 +566,14 @@ def _module_record(
     categories_config: dict[str, str] | None,
     descriptions_cache: dict[str, str] | None = None,
 ) -> dict[str, object]:
-    """Build the module payload used by templates, JSON, and SSE events."""
+    """Build the module payload used by templates, JSON, and SSE events.
+
+    Versions are expected in natural order, as _parse_spider_cache leaves
+    them, so they are not sorted again here.
+    """
     raw_versions = module_entry.get('versions', [])
     versions = raw_versions if isinstance(raw_versions, list) else []
-    sorted_versions = sorted(versions, key=_natural_sort_key)
-    base_name = _module_base_name(family_name, sorted_versions)
+    base_name = _module_base_name(family_name, versions)
     description = module_entry.get('description')
     if not isinstance(description, str):
         description = ''
@@ -379,18 +582,19 @@ def _module_record(
 
     return {
         'name': base_name,
-        'versions': sorted_versions,
+        'versions': versions,
         'description': description,
-        'category': _categorize_module(base_name, categories_config),
+        # Thousands of records share a handful of category names
+        'category': sys.intern(_categorize_module(base_name, categories_config)),
     }
 
 
-def _sse_event(event: dict[str, object]) -> str:
+def _sse_event(event: dict[str, object]) -> bytes:
     """Serialize one server-sent event payload."""
-    return f"data: {json.dumps(event)}\n\n"
+    return b"data: " + json_dumps_bytes(event) + b"\n\n"
 
 
-def _sse_response(events: Iterator[str]) -> Response:
+def _sse_response(events: Iterator[bytes]) -> Response:
     """Return a consistent SSE response for module streaming endpoints."""
     return Response(
         events,
@@ -408,17 +612,19 @@ def _module_records_from_spider_data(
     """Build sorted frontend module records from parsed spider data."""
     categories_config = _load_categories()
     descriptions_cache = _load_descriptions_cache()
-    grouped_modules = [
-        _module_record(
+    # One sort on (display name, family name); family names are unique so
+    # the tuple comparison never falls through to the record dicts.
+    decorated = []
+    for family_name, module_entry in modules_dict.items():
+        record = _module_record(
             family_name,
-            modules_dict[family_name],
+            module_entry,
             categories_config,
             descriptions_cache,
         )
-        for family_name in sorted(modules_dict.keys())
-    ]
-    grouped_modules.sort(key=lambda module: str(module['name']).lower())
-    return grouped_modules
+        decorated.append((str(record['name']).lower(), family_name, record))
+    decorated.sort()
+    return [record for _, _, record in decorated]
 
 
 def _cache_spider_descriptions(
@@ -448,7 +654,7 @@ def _cache_spider_descriptions(
 
 def _get_all_modules_streaming() -> Iterator[dict[str, object]]:
     """
-    Stream module records, preferring the spider cache file over subprocess.
+    Stream module records from the spider cache and store them in the cache.
 
     Yields:
         Dict with 'type' ('progress', 'module', 'complete', 'error').
@@ -472,7 +678,7 @@ def _get_all_modules_streaming() -> Iterator[dict[str, object]]:
         return
 
     try:
-        modules_dict = _parse_spider_cache(cache_path)
+        modules_dict = _read_spider_modules(cache_path)
     except (OSError, ValueError, TypeError) as e:
         logger.error(f"Exception reading spider cache: {e}", exc_info=True)
         yield {'type': 'error', 'message': f'Exception: {str(e)}'}
@@ -493,6 +699,12 @@ def _get_all_modules_streaming() -> Iterator[dict[str, object]]:
     }
 
     _cache_spider_descriptions(modules_dict)
+    # Store the already-sorted records now rather than having the caller
+    # collect a second copy from the module events.
+    _store_modules_cache(
+        grouped_modules,
+        _modules_sources_fingerprint(cache_path),
+    )
 
     for current, module in enumerate(grouped_modules, 1):
         yield {
@@ -533,8 +745,7 @@ def _load_categories():
             logger.warning(f"Categories file not found: {CATEGORIES_FILE}")
             return None
 
-        with CATEGORIES_FILE.open('r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_categories_file()
 
         if isinstance(data, dict):
             # Return only categories, exclude 'descriptions' key
@@ -545,16 +756,21 @@ def _load_categories():
         logger.error(f"Error loading categories: {e}", exc_info=True)
         return None
 
+
+_DIGIT_RUNS = re.compile(r'(\d+)')
+
+
 def _natural_sort_key(text):
     """Generate a sort key for natural (numeric-aware) sorting.
 
     Splits text into alternating text and number parts for proper version sorting.
-    Example: "Armadillo/11.4.3" -> ('Armadillo/', 11, '.', 4, '.', 3)
+    Example: "Armadillo/11.4.3" -> ['armadillo/', 11, '.', 4, '.', 3, '']
     """
-    def convert(text_part):
-        return int(text_part) if text_part.isdigit() else text_part.lower()
-
-    return [convert(part) for part in re.split(r'(\d+)', text)]
+    # The capturing split puts digit runs at the odd indices, so they can be
+    # converted in one C-level map instead of testing every part in Python.
+    parts = _DIGIT_RUNS.split(text.lower())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
 
 def _categorize_module(module_name, categories_config):
     """Assign a category to a module based on configuration.
@@ -604,16 +820,140 @@ def _categorize_module(module_name, categories_config):
     # Default to Misc for unmatched modules
     return 'Misc'
 
-def _get_cached_modules() -> list[dict[str, Any]]:
-    """Get modules from cache. Returns empty list if cache is not ready."""
-    global _modules_cache
+def _wait_for_initial_modules_cache(
+    timeout: float = MODULES_COLD_START_WAIT,
+) -> None:
+    """Block briefly while this process loads its first module cache.
+
+    Cold-start requests get the real data in one load instead of an empty
+    page the client has to poll. Returns early if the load fails (the lock
+    is released without the cache being stored) or the wait times out.
+    """
+    deadline = time.monotonic() + timeout
+    while _modules_snapshot is None and _module_refresh_lock.locked():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        _modules_cache_ready.wait(min(remaining, 0.25))
+
+
+def _modules_list_payload(
+    grouped_modules: list[dict[str, Any]],
+    grouping: tuple[dict[str, list[dict[str, Any]]], list[str]] | None = None,
+) -> dict[str, object]:
+    """Build the JSON payload returned by the modules list endpoint."""
+    modules_by_category, category_order = (
+        grouping or _modules_by_category(grouped_modules)
+    )
+    return {
+        'modules': grouped_modules,
+        'modules_by_category': modules_by_category,
+        'category_order': category_order,
+        'unique_count': len(grouped_modules),
+        'loading': False,
+    }
+
+
+def _modules_columns_payload(
+    grouped_modules: list[dict[str, Any]],
+    category_order: list[str],
+) -> dict[str, object]:
+    """Build the column-oriented list payload (one array per record field).
+
+    Parallel arrays avoid repeating every record key per module and skip the
+    duplicate per-category copy of each record in the default payload.
+    ``categories`` holds indices into ``category_order`` rather than
+    repeating a handful of category names thousands of times.
+    """
+    category_index = {
+        category: index for index, category in enumerate(category_order)
+    }
+    return {
+        'names': [module['name'] for module in grouped_modules],
+        'versions': [module['versions'] for module in grouped_modules],
+        'descriptions': [module['description'] for module in grouped_modules],
+        'categories': [
+            category_index[module['category']] for module in grouped_modules
+        ],
+        'category_order': category_order,
+        'unique_count': len(grouped_modules),
+        'loading': False,
+    }
+
+
+def _store_modules_cache(
+    grouped_modules: list[dict[str, Any]],
+    source_key: tuple[object, ...] | None = None,
+) -> None:
+    """Swap in fresh module records and pre-encode the list response body.
+
+    Args:
+        grouped_modules: Sorted module records
+        source_key: Fingerprint of the files the records were built from,
+            or None when unknown (forces the next revalidation to rebuild)
+    """
+    global _modules_snapshot, _modules_source_key
+
+    grouping = _modules_by_category(grouped_modules)
+    list_body = json_dumps_bytes(
+        _modules_list_payload(grouped_modules, grouping)
+    )
+    columns_body = json_dumps_bytes(
+        _modules_columns_payload(grouped_modules, grouping[1])
+    )
+    # mtime=0 keeps the gzip bytes identical for identical bodies
+    list_gzip = gzip.compress(
+        list_body,
+        compresslevel=MODULES_GZIP_LEVEL,
+        mtime=0,
+    )
+    columns_gzip = gzip.compress(
+        columns_body,
+        compresslevel=MODULES_GZIP_LEVEL,
+        mtime=0,
+    )
+    digest = hashlib.blake2b(
+        list_body,
+        digest_size=8,
+    ).hexdigest()
+    timestamp = time.time()
+    _modules_source_key = source_key
+    # Unlike the timestamp, the modified time is not bumped by no-op
+    # revalidations
+    _modules_snapshot = (
+        grouped_modules,
+        grouping,
+        timestamp,
+        list_body,
+        columns_body,
+        list_gzip,
+        columns_gzip,
+        digest,
+        timestamp,
+    )
+    _modules_cache_ready.set()
 
-    if _modules_cache is not None:
-        return _modules_cache
 
-    # Cache not ready yet - return empty list
-    # Preload will populate it on startup
-    return []
+def _modules_sources_fingerprint(
+    cache_path: Path,
+) -> tuple[object, ...] | None:
+    """Fingerprint the spider cache and categories file by path/mtime/size."""
+    try:
+        spider_key = _spider_cache_key(cache_path)
+    except OSError:
+        return None
+
+    try:
+        categories_stat = CATEGORIES_FILE.stat()
+    except OSError:
+        categories_key = None
+    else:
+        categories_key = (
+            str(CATEGORIES_FILE),
+            categories_stat.st_mtime_ns,
+            categories_stat.st_size,
+        )
+    return spider_key, categories_key
 
 
 def _modules_by_category(
@@ -645,16 +985,56 @@ def timestamp_to_datetime_filter(timestamp: float | None) -> str:
         return 'Unknown'
 
 
+def _schedule_modules_revalidation() -> str:
+    """Start a background reload if the cache is stale; return cache status.
+
+    Requests never wait on the spider cache: stale (or empty) data is
+    served immediately while a daemon thread rebuilds it.
+    """
+    global _last_revalidation_start
+
+    now = time.time()
+    snapshot = _modules_snapshot
+    if snapshot is not None and now - snapshot[2] < MODULES_CACHE_TTL:
+        return 'fresh'
+    if _module_refresh_lock.locked():
+        return 'stale-revalidating'
+    if (
+        _last_revalidation_start is not None
+        and now - _last_revalidation_start < MODULES_REVALIDATE_INTERVAL
+    ):
+        return 'stale'
+    if (
+        not current_app.config.get('START_BACKGROUND_THREADS')
+        or current_app.config.get('TESTING')
+    ):
+        return 'stale'
+
+    _last_revalidation_start = now
+    threading.Thread(
+        target=_revalidate_modules_cache,
+        name='module-cache-revalidate',
+        daemon=True,
+    ).start()
+    return 'stale-revalidating'
+
+
 @modules_bp.route('/')
 def modules():
     """Render the modules page."""
-    grouped_modules = _get_cached_modules()
+    cache_status = _schedule_modules_revalidation()
+    _wait_for_initial_modules_cache()
+    # Preload fills the snapshot on startup; until then the page is empty
+    snapshot = _modules_snapshot
+    if snapshot is None:
+        grouped_modules, grouping, cache_timestamp = [], ({}, []), None
+    else:
+        grouped_modules, grouping, cache_timestamp = snapshot[:3]
+    modules_by_category, category_order = grouping
     unique_count = len(grouped_modules)
-    cache_exists = _modules_cache is not None and len(grouped_modules) > 0
-    modules_by_category, category_order = _modules_by_category(grouped_modules)
-    cache_timestamp = _modules_cache_timestamp if _modules_cache_timestamp else None
+    cache_exists = len(grouped_modules) > 0
 
-    return render_template(
+    response = current_app.make_response(render_template(
         'modules.html',
         modules=grouped_modules,
         modules_by_category=modules_by_category,
@@ -662,30 +1042,108 @@ def modules():
         unique_count=unique_count,
         cache_empty=not cache_exists,
         cache_timestamp=cache_timestamp
-    )
+    ))
+    response.headers['X-Cache-Status'] = cache_status
+    return response
 
 @modules_bp.route('/list')
 def modules_list():
-    """Return JSON list of modules from cache."""
-    grouped_modules = _get_cached_modules()
-    unique_count = len(grouped_modules)
-    modules_by_category, category_order = _modules_by_category(grouped_modules)
+    """Return JSON list of modules from cache.
+
+    ``?format=columns`` returns parallel arrays instead of one dict per module.
+    Clients that accept gzip get the body compressed when it was cached.
+    """
+    list_format = request.args.get('format', 'records')
+    if list_format not in {'records', 'columns'}:
+        return jsonify({'error': f'Unknown list format: {list_format}'}), 400
+
+    cache_status = _schedule_modules_revalidation()
+    _wait_for_initial_modules_cache()
+    columns = list_format == 'columns'
+    snapshot = _modules_snapshot
+    if snapshot is None:
+        if columns:
+            response = jsonify(_modules_columns_payload([], []))
+        else:
+            response = jsonify(_modules_list_payload([]))
+        response.headers['X-Cache-Status'] = cache_status
+        return response
+
+    (
+        _records,
+        _grouping,
+        timestamp,
+        list_body,
+        columns_body,
+        list_gzip,
+        columns_gzip,
+        digest,
+        modified,
+    ) = snapshot
+    body, compressed = (
+        (columns_body, columns_gzip) if columns else (list_body, list_gzip)
+    )
+    etag = f"modules-{list_format}-{digest}"
+    use_gzip = request.accept_encodings.quality('gzip') > 0
+    response = Response(
+        compressed if use_gzip else body,
+        mimetype='application/json',
+    )
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+        # Each encoding is a separate representation with its own ETag
+        etag += '-gzip'
+    response.vary.add('Accept-Encoding')
+    response.headers['X-Cache-Status'] = cache_status
+    response.set_etag(etag)
+    # Let the browser reuse the body until the server copy goes stale, then
+    # keep showing it while it revalidates, mirroring the server's own
+    # stale-while-revalidate. Private: Open OnDemand puts every app behind
+    # per-user auth.
+    response.cache_control.private = True
+    response.cache_control.max_age = max(
+        int(MODULES_CACHE_TTL - (time.time() - timestamp)),
+        0,
+    )
+    response.cache_control.stale_while_revalidate = MODULES_CACHE_TTL
+    response.last_modified = modified
+    return response.make_conditional(request)
 
-    return jsonify({
-        'modules': grouped_modules,
-        'modules_by_category': modules_by_category,
-        'category_order': category_order,
-        'unique_count': unique_count,
-        'loading': False
-    })
+
+@modules_bp.route('/ready-stream')
+def modules_ready_stream():
+    """Push the cached module list once this worker's first load finishes.
+
+    Sends one ``ready`` event carrying the pre-encoded list body, or an
+    ``empty`` event if no load is running, so the page can start a refresh.
+    """
+
+    def generate() -> Iterator[bytes]:
+        _wait_for_initial_modules_cache(MODULES_READY_STREAM_WAIT)
+        snapshot = _modules_snapshot
+        if snapshot is None:
+            yield b"event: empty\ndata: {}\n\n"
+            return
+        body = snapshot[3]
+        # Compact JSON has no raw newlines, so it fits in one data line
+        yield b"event: ready\ndata: " + body + b"\n\n"
+
+    return _sse_response(generate())
 
 
 @modules_bp.route('/refresh-start', methods=['POST'])
 def refresh_start():
     """Confirm a refresh can start before the client opens the SSE stream."""
-    with _streaming_lock:
-        if _streaming_in_progress:
-            return jsonify({'error': 'Refresh already in progress'}), 409
+    if _module_refresh_lock.locked():
+        return jsonify({'error': 'Refresh already in progress'}), 409
+
+    # The flock is the source of truth across Passenger workers; probe it so
+    # the client is told now instead of by an error event on the stream.
+    with _module_refresh_file_lock() as lock_acquired:
+        if not lock_acquired:
+            return jsonify({
+                'error': 'Module refresh is already running in another worker'
+            }), 409
 
     return jsonify({'status': 'started'})
 
@@ -693,19 +1151,13 @@ def refresh_start():
 @modules_bp.route('/refresh-stream')
 def refresh_modules():
     """Stream fresh module data via SSE (GET endpoint for EventSource)."""
-    global _streaming_in_progress
-
-    def generate() -> Iterator[str]:
-        global _streaming_in_progress
-        error_message = None
-        with _streaming_lock:
-            if _streaming_in_progress:
-                error_message = 'Refresh already in progress'
-            else:
-                _streaming_in_progress = True
 
-        if error_message:
-            yield _sse_event({'type': 'error', 'message': error_message})
+    def generate() -> Iterator[bytes]:
+        if not _module_refresh_lock.acquire(blocking=False):
+            yield _sse_event({
+                'type': 'error',
+                'message': 'Refresh already in progress',
+            })
             return
 
         try:
@@ -720,24 +1172,10 @@ def refresh_modules():
                     })
                     return
 
-                all_modules = []
                 for event in _get_all_modules_streaming():
-                    if event['type'] == 'module':
-                        all_modules.append(event['module'])
-                        yield _sse_event(event)
-                    elif event['type'] == 'complete':
-                        global _modules_cache, _modules_cache_timestamp
-                        _modules_cache = sorted(
-                            all_modules,
-                            key=lambda m: m['name'].lower(),
-                        )
-                        _modules_cache_timestamp = time.time()
-                        yield _sse_event(event)
-                    elif event['type'] in {'progress', 'error'}:
-                        yield _sse_event(event)
+                    yield _sse_event(event)
         finally:
-            with _streaming_lock:
-                _streaming_in_progress = False
+            _module_refresh_lock.release()
 
     return _sse_response(generate())
 
@@ -745,21 +1183,35 @@ def refresh_modules():
 @modules_bp.route('/refresh-status')
 def refresh_status():
     """Check if refresh is in progress."""
-    with _streaming_lock:
-        return jsonify({'in_progress': _streaming_in_progress})
+    return jsonify({'in_progress': _module_refresh_lock.locked()})
 
 
-def _preload_modules_cache() -> None:
-    """Preload modules cache on startup by reading the Lmod spider cache."""
-    global _modules_cache, _modules_cache_timestamp
+def _load_modules_cache(skip_if_cached: bool) -> None:
+    """Rebuild the in-memory module cache from the Lmod spider cache.
+
+    Args:
+        skip_if_cached: Return without work if another thread already
+            populated the cache (startup preload)
+    """
+    global _modules_snapshot
+
+    if skip_if_cached and _modules_snapshot is not None:
+        return
+
+    if not _module_refresh_lock.acquire(blocking=False):
+        logger.info("Skipping module cache load; a refresh is already running")
+        return
 
-    logger.info("Preloading modules cache on startup...")
     try:
+        # A refresh may have filled the cache while this thread was starting.
+        if skip_if_cached and _modules_snapshot is not None:
+            return
+
         with _module_refresh_file_lock() as lock_acquired:
             if not lock_acquired:
                 logger.info(
-                    "Skipping module preload; another worker is refreshing "
-                    "module data"
+                    "Skipping module cache load; another worker is "
+                    "refreshing module data"
                 )
                 return
 
@@ -772,7 +1224,18 @@ def _preload_modules_cache() -> None:
                 )
                 return
 
-            modules_dict = _parse_spider_cache(cache_path)
+            source_key = _modules_sources_fingerprint(cache_path)
+            snapshot = _modules_snapshot
+            if (
+                source_key is not None
+                and source_key == _modules_source_key
+                and snapshot is not None
+            ):
+                _modules_snapshot = (*snapshot[:2], time.time(), *snapshot[3:])
+                logger.debug("Module sources unchanged; kept cached records")
+                return
+
+            modules_dict = _read_spider_modules(cache_path)
             if not modules_dict:
                 logger.warning("Failed to parse spider cache at %s", cache_path)
                 return
@@ -780,15 +1243,45 @@ def _preload_modules_cache() -> None:
             grouped_modules = _module_records_from_spider_data(modules_dict)
             _cache_spider_descriptions(modules_dict)
 
-            _modules_cache = grouped_modules
-            _modules_cache_timestamp = time.time()
+            # Saving descriptions can rewrite the categories file
+            _store_modules_cache(
+                grouped_modules,
+                _modules_sources_fingerprint(cache_path),
+            )
 
             total_versions = sum(len(m['versions']) for m in grouped_modules)
             logger.info(
-                "Modules cache preloaded: %d families, %d total versions",
+                "Modules cache loaded: %d families, %d total versions",
                 len(grouped_modules),
                 total_versions,
             )
 
     except (OSError, ValueError, TypeError) as e:
-        logger.error(f"Error preloading modules cache: {e}", exc_info=True)
+        logger.error(f"Error loading modules cache: {e}", exc_info=True)
+    finally:
+        _module_refresh_lock.release()
+
+
+def _preload_modules_cache() -> None:
+    """Preload modules cache on startup by reading the Lmod spider cache."""
+    logger.info("Preloading modules cache on startup...")
+    _load_modules_cache(skip_if_cached=True)
+
+
+def _revalidate_modules_cache() -> None:
+    """Reload a stale modules cache in the background."""
+    logger.info("Revalidating stale modules cache...")
+    _load_modules_cache(skip_if_cached=False)
+
+
+def _keep_modules_cache_warm() -> None:
+    """Preload the module cache, then revalidate it ahead of its TTL.
+
+    Runs for the life of the process on a daemon thread. Revalidating an
+    unchanged spider cache only stats two files, so requests keep finding
+    fresh data without triggering their own reload.
+    """
+    _preload_modules_cache()
+    while True:
+        time.sleep(MODULES_KEEP_WARM_INTERVAL)
+        _load_modules_cache(skip_if_cached=False)
@@ -1,24 +1,45 @@
+import functools
+import gzip
+import hashlib
 import json
 import logging
 import os
 import shutil
 import subprocess
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from flask import Blueprint, jsonify, render_template, request
 
-from utils import expand_path, load_settings, validate_project_directory
+from utils import (
+    atomic_write_bytes,
+    expand_path,
+    json_dumps_bytes,
+    json_loads,
+    load_settings,
+    read_file_bytes,
+    validate_project_directory,
+)
 
 projects_bp = Blueprint('projects', __name__, url_prefix='/projects')
 logger = logging.getLogger(__name__)
 
 PROJECT_DIRS_CONFIG_KEY = 'project_directories'
-PROJECTS_CACHE_FILE = Path('logs/projects_cache.json')
+PROJECTS_CACHE_FILE = Path('logs/projects_cache.json.gz')
+# Fast gzip level: the cache is rewritten after every scan
+PROJECTS_CACHE_GZIP_LEVEL = 3
+# Set once this worker has removed the uncompressed cache file that
+# PROJECTS_CACHE_FILE replaced (its name without the .gz suffix)
+_legacy_projects_cache_removed = False
 CACHE_VALIDITY_SECONDS = 3600  # 1 hour
-PROJECTS_CACHE_SCHEMA_VERSION = 2
+PROJECTS_CACHE_SCHEMA_VERSION = 3
+# Per-repo reuse bookkeeping kept in the cache file but not sent to clients
+_CACHE_ONLY_FIELDS = frozenset({'cache_key', 'scanned_at'})
 PROJECT_REPO_ERRORS: tuple[type[Exception], ...] = (
     OSError,
     subprocess.SubprocessError,
@@ -31,9 +52,35 @@ PROJECT_REPO_ERRORS: tuple[type[Exception], ...] = (
 _CHECKER_TIMEOUT_BASE = 120
 _CHECKER_TIMEOUT_PER_DIR = 60
 
+# Tool-generated directories that can hold huge trees but no repositories
+# of their own; the repo search checks them for .git without descending.
+# Hidden ones (.venv, .tox, .cache, ...) are already skipped by name.
+_SCAN_SKIP_DIRS = frozenset({
+    '__pycache__',
+    'build',
+    'dist',
+    'node_modules',
+    'site-packages',
+    'target',
+    'venv',
+})
+
+# Untracked files above this size are listed in a project's footprint
+LARGE_FILE_BYTES = 1024 * 1024
+
+# Per-repo work is dominated by git subprocesses and stat calls, so a few
+# threads overlap it well; kept small because login nodes are shared.
+PROJECT_SCAN_WORKERS = min(8, (os.cpu_count() or 1) * 2)
 
+
+@functools.lru_cache(maxsize=1)
 def _find_checker_binary() -> str | None:
-    """Locate git-status-checker on PATH or in common pip locations."""
+    """Locate git-status-checker on PATH or in common pip locations.
+
+    Memoized for the life of the worker: the PATH scan and location probes
+    run once instead of on every project scan. A binary installed after
+    startup is picked up when the app restarts.
+    """
     found = shutil.which('git-status-checker')
     if found:
         return found
@@ -84,19 +131,19 @@ def _call_git_status_checker(
     )
 
     try:
+        # Output stays as bytes: json_loads parses them directly, with no
+        # intermediate str copy of a report that can run to megabytes
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
-            env=os.environ.copy(),
-            cwd=Path.cwd(),
             check=False,
         )
 
         if result.stderr:
             logger.debug(
-                "git-status-checker stderr: %s", result.stderr[:500]
+                "git-status-checker stderr: %s",
+                result.stderr[:500].decode('utf-8', 'replace'),
             )
 
         # exit 0 = all clean, exit 1 = some repos outdated (still valid JSON)
@@ -109,7 +156,7 @@ def _call_git_status_checker(
         if not output:
             return [], None
 
-        data = json.loads(output)
+        data = json_loads(output)
         repos = data.get('repositories', [])
         logger.info(
             "git-status-checker found %d repositories in %d directories",
@@ -133,7 +180,8 @@ def _git_info_from_checker(
     """Build a git_info dict from git-status-checker output.
 
     git-status-checker provides dirty/ahead/behind/up_to_date already.
-    Branch, last commit, and remote URL still need lightweight git calls.
+    Branch and last commit come from one ``git log`` call and the remote URL
+    from one ``git config`` call.
     """
     git_info: dict[str, Any] = {
         'path': str(repo_path),
@@ -152,21 +200,24 @@ def _git_info_from_checker(
     }
 
     try:
-        git_info['branch'] = _repo_stdout(
-            repo_path, ['rev-parse', '--abbrev-ref', 'HEAD']
-        )
-
+        # One log call yields HEAD's decoration (the branch) and last commit
         log_line = _repo_stdout(
             repo_path,
-            ['log', '-1', '--format=%H|%an|%ae|%ad|%s', '--date=iso'],
+            ['log', '-1', '--format=%D%x00%H%x00%an%x00%ad', '--date=iso'],
         )
         if log_line:
-            parts = log_line.split('|', 4)
-            if len(parts) >= 4:
-                git_info['last_commit'] = parts[0][:8]
-                git_info['last_commit_author'] = parts[1]
+            parts = log_line.split('\0')
+            if len(parts) == 4:
+                git_info['branch'] = _branch_from_decoration(parts[0])
+                git_info['last_commit'] = parts[1][:8]
+                git_info['last_commit_author'] = parts[2]
                 git_info['last_commit_date'] = parts[3]
 
+        if git_info['branch'] is None:
+            git_info['branch'] = _repo_stdout(
+                repo_path, ['rev-parse', '--abbrev-ref', 'HEAD']
+            )
+
         git_info['remote'] = _get_remote_url(
             repo_path, git_info['branch']
         )
@@ -181,6 +232,9 @@ def _git_info_from_checker(
 
 def _repo_stdout(repo_path: Path, args: list[str]) -> str | None:
     """Run a read-only git command and return trimmed stdout when it succeeds."""
+    # Default spawn options on purpose: since Python 3.10 (the oldest version
+    # supported) CPython already uses vfork() for this call on Linux, and
+    # its posix_spawn() path would need cwd=None and close_fds=False.
     result = subprocess.run(
         ['git', *args],
         cwd=repo_path,
@@ -195,36 +249,90 @@ def _repo_stdout(repo_path: Path, args: list[str]) -> str | None:
     return output or None
 
 
+def _branch_from_decoration(decoration: str) -> str | None:
+    """Return the checked-out branch from a ``git log --format=%D`` string.
+
+    ``'HEAD -> main, origin/main'`` gives ``'main'``; a detached HEAD gives
+    ``'HEAD'`` like ``git rev-parse --abbrev-ref HEAD``.
+    """
+    refs = decoration.split(', ')
+    if refs[0].startswith('HEAD -> '):
+        return refs[0][len('HEAD -> '):] or None
+    if 'HEAD' in refs:
+        return 'HEAD'
+    return None
+
+
 def _get_remote_url(
     repo_path: Path,
     branch: str | None,
 ) -> str | None:
-    """Return the best available remote URL for a repository."""
-    if branch and branch != 'HEAD':
-        upstream_remote = _repo_stdout(
-            repo_path,
-            ['config', '--get', f'branch.{branch}.remote'],
-        )
-        if upstream_remote and upstream_remote != '.':
-            upstream_url = _repo_stdout(
-                repo_path,
-                ['remote', 'get-url', upstream_remote],
-            )
-            if upstream_url:
-                return upstream_url
-
-    origin_url = _repo_stdout(repo_path, ['remote', 'get-url', 'origin'])
-    if origin_url:
-        return origin_url
+    """Return the best available remote URL for a repository.
 
-    first_remote = _repo_stdout(repo_path, ['remote'])
-    if not first_remote:
+    Remote URLs and the branch's upstream remote come from one ``git config``
+    call; the upstream remote is preferred, then ``origin``, then the first
+    configured remote.
+    """
+    output = _repo_stdout(
+        repo_path,
+        [
+            'config', '-z', '--get-regexp',
+            r'^(branch\..*\.remote|remote\..*\.url)$',
+        ],
+    )
+    if not output:
         return None
 
-    remote_name = first_remote.splitlines()[0].strip()
-    if not remote_name:
-        return None
-    return _repo_stdout(repo_path, ['remote', 'get-url', remote_name])
+    remote_urls: dict[str, str] = {}
+    upstream_remote = None
+    for entry in output.split('\0'):
+        key, _, value = entry.partition('\n')
+        if key.startswith('remote.') and key.endswith('.url'):
+            remote_urls.setdefault(key[len('remote.'):-len('.url')], value)
+        elif branch and branch != 'HEAD' and key == f'branch.{branch}.remote':
+            upstream_remote = value
+
+    if upstream_remote and upstream_remote in remote_urls:
+        return remote_urls[upstream_remote]
+    if 'origin' in remote_urls:
+        return remote_urls['origin']
+    return next(iter(remote_urls.values()), None)
+
+
+def _parse_status_branch_header(
+    header: str,
+) -> tuple[str | None, tuple[int, int] | None]:
+    """Parse the ``## ...`` line of ``git status --porcelain --branch``.
+
+    Returns (branch, (ahead, behind)). The counts are None when the branch
+    has no upstream or the upstream ref is gone. A detached HEAD is reported
+    as ``'HEAD'``, matching ``git rev-parse --abbrev-ref HEAD``.
+    """
+    header = header[3:].strip()
+    tracking = ''
+    if header.endswith(']') and ' [' in header:
+        header, _, tracking = header[:-1].rpartition(' [')
+
+    if header.startswith('HEAD (no branch)'):
+        return 'HEAD', None
+
+    for prefix in ('No commits yet on ', 'Initial commit on '):
+        if header.startswith(prefix):
+            return header[len(prefix):] or None, None
+
+    branch, separator, _ = header.partition('...')
+    counts = None
+    if separator and tracking != 'gone':
+        # An in-sync upstream prints no bracketed counts at all
+        ahead = behind = 0
+        for part in filter(None, tracking.split(', ')):
+            kind, _, value = part.partition(' ')
+            if kind == 'ahead':
+                ahead = int(value)
+            elif kind == 'behind':
+                behind = int(value)
+        counts = (ahead, behind)
+    return branch or None, counts
 
 
 def _get_git_info(repo_path: Path) -> dict[str, Any] | None:
@@ -259,28 +367,22 @@ def _get_git_info(repo_path: Path) -> dict[str, Any] | None:
         if not git_dir.exists():
             return None
         
-        # Get current branch
-        result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            git_info['branch'] = result.stdout.strip()
-        
-        # Check if dirty (uncommitted changes)
+        # Branch, upstream counts and local changes in one status call
         result = subprocess.run(
-            ['git', 'status', '--porcelain'],
+            ['git', 'status', '--porcelain', '--branch'],
             cwd=repo_path,
             capture_output=True,
             text=True,
             timeout=10,
         )
+        ahead_behind = None
         if result.returncode == 0:
-            changes = result.stdout.strip().split('\n')
-            changes = [c for c in changes if c.strip()]
+            lines = result.stdout.splitlines()
+            if lines and lines[0].startswith('## '):
+                branch, ahead_behind = _parse_status_branch_header(lines[0])
+                git_info['branch'] = branch
+                lines = lines[1:]
+            changes = [line for line in lines if line.strip()]
             git_info['dirty'] = len(changes) > 0
             git_info['local_changes'] = changes
         
@@ -301,25 +403,14 @@ def _get_git_info(repo_path: Path) -> dict[str, Any] | None:
         
         git_info['remote'] = _get_remote_url(repo_path, git_info['branch'])
         
-        # Check ahead/behind (only if remote exists)
-        if git_info['branch'] and git_info.get('remote'):
-            try:
-                result = subprocess.run(
-                    ['git', 'rev-list', '--left-right', '--count', f'origin/{git_info["branch"]}...HEAD'],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    parts = result.stdout.strip().split()
-                    if len(parts) == 2:
-                        git_info['behind'] = int(parts[0]) > 0
-                        git_info['ahead'] = int(parts[1]) > 0
-                        git_info['up_to_date'] = int(parts[0]) == 0 and int(parts[1]) == 0 and not git_info['dirty']
-            except (ValueError, subprocess.TimeoutExpired):
-                # If remote branch doesn't exist or other error, just continue
-                pass
+        # Ahead/behind relative to the tracked upstream, when there is one
+        if ahead_behind is not None:
+            ahead, behind = ahead_behind
+            git_info['ahead'] = ahead > 0
+            git_info['behind'] = behind > 0
+            git_info['up_to_date'] = (
+                ahead == 0 and behind == 0 and not git_info['dirty']
+            )
         
         return git_info
         
@@ -328,6 +419,51 @@ def _get_git_info(repo_path: Path) -> dict[str, Any] | None:
         return None
 
 
+def _walk_for_git_repos(base_path: Path) -> list[Path]:
+    """Return repositories below base_path, never descending into one.
+
+    Uses an explicit ``os.scandir`` stack so directory checks come from each
+    entry's cached type, and stops reading a listing as soon as it shows a
+    ``.git`` directory. Hidden directories are skipped and unreadable ones
+    ignored, as with the previous ``os.walk`` loop. Dependency and build
+    output directories (``_SCAN_SKIP_DIRS``) are only probed for their own
+    ``.git``, never descended into.
+    """
+    repos: list[Path] = []
+    stack = [str(base_path)]
+    while stack:
+        current = stack.pop()
+        subdirs: list[str] = []
+        skipped_repos: list[Path] = []
+        is_repo = False
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == '.git':
+                        if entry.is_dir():
+                            is_repo = True
+                            break
+                    elif not entry.name.startswith('.') and entry.is_dir(
+                        follow_symlinks=False
+                    ):
+                        if entry.name not in _SCAN_SKIP_DIRS:
+                            subdirs.append(entry.path)
+                        elif os.path.isdir(os.path.join(entry.path, '.git')):
+                            skipped_repos.append(Path(entry.path))
+        except OSError as e:
+            logger.debug("Cannot scan directory %s: %s", current, e)
+            continue
+
+        if is_repo:
+            logger.debug("Found git repository: %s", current)
+            repos.append(Path(current))
+        else:
+            repos.extend(skipped_repos)
+            # Reversed so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+    return repos
+
+
 def _find_git_repos(base_dirs: list[str]) -> list[Path]:
     """
     Find all git repositories in base directories.
@@ -339,13 +475,13 @@ def _find_git_repos(base_dirs: list[str]) -> list[Path]:
         List of Path objects pointing to git repositories
     """
     repos = []
-    logger.info(f"Scanning for git repositories in: {base_dirs}")
+    logger.debug("Scanning for git repositories in: %s", base_dirs)
     
     for base_dir in base_dirs:
         try:
             expanded = expand_path(base_dir)
             base_path = Path(expanded)
-            logger.info(f"Checking base directory: {base_dir} -> {base_path} (exists: {base_path.exists()})")
+            logger.debug("Checking base directory: %s -> %s", base_dir, base_path)
             
             if not base_path.exists():
                 logger.warning(f"Base directory does not exist: {base_path}")
@@ -353,29 +489,16 @@ def _find_git_repos(base_dirs: list[str]) -> list[Path]:
             
             # Check if the base directory itself is a git repo
             if (base_path / '.git').exists():
-                logger.info(f"Found git repo at base directory: {base_path}")
+                logger.debug("Found git repo at base directory: %s", base_path)
                 repos.append(base_path)
                 continue
             
             # Walk directory tree looking for .git directories
-            repo_count_before = len(repos)
-            try:
-                for root, dirs, files in os.walk(base_path):
-                    # Skip hidden directories (except .git)
-                    dirs[:] = [d for d in dirs if not d.startswith('.') or d == '.git']
-                    
-                    if '.git' in dirs:
-                        repo_path = Path(root)
-                        logger.debug(f"Found git repository: {repo_path}")
-                        repos.append(repo_path)
-                        # Don't recurse into subdirectories of a git repo
-                        dirs.remove('.git')
-                        dirs.clear()  # Stop recursion
-                
-                logger.info(f"Found {len(repos) - repo_count_before} repositories in {base_path}")
-            except (PermissionError, OSError) as e:
-                logger.warning(f"Error scanning directory {base_path}: {e}")
-                continue
+            found = _walk_for_git_repos(base_path)
+            repos.extend(found)
+            logger.debug(
+                "Found %d repositories in %s", len(found), base_path
+            )
         except OSError as e:
             logger.error(f"Error processing directory {base_dir}: {e}", exc_info=True)
             continue
@@ -384,6 +507,30 @@ def _find_git_repos(base_dirs: list[str]) -> list[Path]:
     return repos
 
 
+def _parse_porcelain_v2_paths(output: str) -> list[str]:
+    """Return changed paths from ``git status --porcelain=v2 -z`` output.
+
+    Ordinary (``1``), renamed/copied (``2``) and unmerged (``u``) records
+    contribute their current path; headers and untracked or ignored entries
+    are skipped.
+    """
+    # Fields before the path in each record type
+    path_field = {'1': 8, '2': 9, 'u': 10}
+    paths: list[str] = []
+    records = iter(output.split('\0'))
+    for record in records:
+        index = path_field.get(record[:1])
+        if index is None:
+            continue
+        fields = record.split(' ', index)
+        if len(fields) > index:
+            paths.append(fields[index])
+        if record[0] == '2':
+            # The original path follows as its own NUL-terminated record
+            next(records, None)
+    return paths
+
+
 def _check_reproducibility_health(repo_path: Path) -> dict[str, Any]:
     """
     Check reproducibility health indicators for a repository.
@@ -472,20 +619,23 @@ def _check_reproducibility_health(repo_path: Path) -> dict[str, Any]:
             last_commit_time = int(result.stdout.strip())
             last_commit_dt = datetime.fromtimestamp(last_commit_time)
             
-            # Check if any tracked files are newer than last commit
+            # Check if any changed tracked files are newer than last commit;
+            # git's index already knows which ones differ, so only those
+            # are stat'ed here
             result = subprocess.run(
-                ['git', 'ls-files'],
+                [
+                    'git', 'status', '--porcelain=v2', '-z',
+                    '--untracked-files=no',
+                ],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
             if result.returncode == 0:
-                tracked_files = result.stdout.strip().split('\n')
+                changed_files = _parse_porcelain_v2_paths(result.stdout)
                 modified_after_commit = []
-                for file_path in tracked_files:
-                    if not file_path:
-                        continue
+                for file_path in changed_files:
                     full_path = repo_path / file_path
                     if full_path.exists():
                         file_mtime = full_path.stat().st_mtime
@@ -502,11 +652,64 @@ def _check_reproducibility_health(repo_path: Path) -> dict[str, Any]:
                     'count': len(modified_after_commit),
                 }
     except (OSError, subprocess.SubprocessError, ValueError) as e:
-        logger.debug(f"Unable to check staleness for {repo_path}: {e}")
+        logger.debug("Unable to check staleness for %s: %s", repo_path, e)
     
     return health
 
 
+def _measure_repo_tree(
+    repo_path: Path,
+) -> tuple[int, int, float, dict[str, int]]:
+    """Sum file sizes in one ``os.scandir`` traversal of a repository.
+
+    Returns (work tree bytes, ``.git`` bytes, newest work tree mtime, and
+    the sizes of work tree files over ``LARGE_FILE_BYTES`` keyed by their
+    repo-relative path). Hidden directories outside ``.git`` are skipped
+    and symlinked directories are not followed; file symlinks count their
+    target.
+    """
+    total_size = 0
+    git_size = 0
+    last_modified = 0.0
+    large_files: dict[str, int] = {}
+    root = str(repo_path)
+    prefix_len = len(root) + 1
+    stack: list[tuple[str, bool]] = [(root, False)]
+    while stack:
+        current, inside_git = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            continue
+                        if inside_git:
+                            stack.append((entry.path, True))
+                        elif entry.name == '.git':
+                            stack.append((entry.path, current == root))
+                        elif not entry.name.startswith('.'):
+                            stack.append((entry.path, False))
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                if inside_git:
+                    git_size += stat.st_size
+                else:
+                    total_size += stat.st_size
+                    if stat.st_mtime > last_modified:
+                        last_modified = stat.st_mtime
+                    if stat.st_size > LARGE_FILE_BYTES:
+                        large_files[entry.path[prefix_len:]] = stat.st_size
+
+    return total_size, git_size, last_modified, large_files
+
+
 def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
     """
     Check filesystem drift and footprint for a repository.
@@ -527,35 +730,10 @@ def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
     }
     
     try:
-        total_size = 0
-        git_size = 0
-        last_modified = 0.0
         git_dir = repo_path / '.git'
-        git_dir_str = str(git_dir)
-
-        for root, dirs, files in os.walk(repo_path):
-            inside_git = root == git_dir_str or root.startswith(
-                git_dir_str + os.sep
-            )
-
-            for file in files:
-                try:
-                    stat = (Path(root) / file).stat()
-                except (OSError, PermissionError):
-                    continue
-
-                if inside_git:
-                    git_size += stat.st_size
-                else:
-                    total_size += stat.st_size
-                    if stat.st_mtime > last_modified:
-                        last_modified = stat.st_mtime
-
-            if not inside_git:
-                dirs[:] = [
-                    d for d in dirs
-                    if d == '.git' or not d.startswith('.')
-                ]
+        total_size, git_size, last_modified, large_files = _measure_repo_tree(
+            repo_path
+        )
 
         info['directory_size'] = total_size
         if git_dir.exists():
@@ -563,6 +741,20 @@ def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
         if last_modified > 0:
             info['last_modified'] = datetime.fromtimestamp(last_modified).isoformat()
         
+        # One status listing answers both "is the repo dirty?" (any line)
+        # and "which files are untracked?" for the large-file check below
+        status_result = subprocess.run(
+            ['git', 'status', '--porcelain', '-z', '--untracked-files=all'],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        status_lines = (
+            [line for line in status_result.stdout.split('\0') if line]
+            if status_result.returncode == 0 else []
+        )
+
         # Get last commit time
         result = subprocess.run(
             ['git', 'log', '-1', '--format=%ct'],
@@ -578,16 +770,7 @@ def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
             # Calculate drift - only show for dirty repos (uncommitted changes)
             drift_days = None
             
-            # Check git status for uncommitted changes
-            status_result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            if status_result.returncode == 0 and status_result.stdout.strip():
+            if status_lines:
                 # Has uncommitted changes - calculate drift
                 if last_modified > 0 and last_modified > last_commit_time:
                     drift_seconds = last_modified - last_commit_time
@@ -596,34 +779,32 @@ def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
             
             info['drift_days'] = drift_days
         
-        # Find large untracked files (> 1MB)
-        result = subprocess.run(
-            ['git', 'status', '--porcelain', '--untracked-files=all'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if line.startswith('??'):  # Untracked file
-                    file_path = line[3:].strip()
-                    full_path = repo_path / file_path
-                    if full_path.exists() and full_path.is_file():
-                        try:
-                            size = full_path.stat().st_size
-                            if size > 1024 * 1024:  # > 1MB
-                                info['large_untracked_files'].append({
-                                    'path': file_path,
-                                    'size': size,
-                                    'size_mb': round(size / (1024 * 1024), 2),
-                                })
-                        except (OSError, PermissionError):
-                            pass
+        # Find large untracked files (> 1MB). Sizes come from the walk
+        # above; only paths under hidden directories, which it skips, need
+        # their own stat.
+        for line in status_lines:
+            if not line.startswith('?? '):  # Untracked file
+                continue
+            file_path = line[3:]
+            size = large_files.get(file_path)
+            if size is None and any(
+                part.startswith('.') for part in file_path.split('/')[:-1]
+            ):
+                full_path = repo_path / file_path
+                try:
+                    if full_path.is_file():
+                        size = full_path.stat().st_size
+                except OSError:
+                    pass
+            if size is not None and size > LARGE_FILE_BYTES:
+                info['large_untracked_files'].append({
+                    'path': file_path,
+                    'size': size,
+                    'size_mb': round(size / (1024 * 1024), 2),
+                })
         
         # Sort by size descending
-        info['large_untracked_files'].sort(key=lambda x: x['size'], reverse=True)
+        info['large_untracked_files'].sort(key=itemgetter('size'), reverse=True)
         # Limit to top 10
         info['large_untracked_files'] = info['large_untracked_files'][:10]
         
@@ -632,12 +813,100 @@ def _check_drift_and_footprint(repo_path: Path) -> dict[str, Any]:
     
     return info
 
-def _process_repo(repo_path: Path) -> dict[str, Any] | None:
+def _repo_cache_key(
+    repo_path: Path,
+    git_info: dict[str, Any],
+) -> str | None:
+    """Return a digest that changes when a repo's health data may change.
+
+    Combines HEAD (commit and branch), the local change list from the fresh
+    git status, and the repository directory's mtime.
+    """
+    try:
+        mtime_ns = repo_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    state = repr((
+        git_info.get('last_commit'),
+        git_info.get('branch'),
+        git_info.get('local_changes'),
+        mtime_ns,
+    ))
+    return hashlib.blake2b(state.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _repo_health(
+    repo_path: Path,
+    git_info: dict[str, Any],
+    previous: dict[str, Any] | None,
+) -> tuple[dict[str, Any], dict[str, Any], str | None, float]:
+    """Return reproducibility, drift/footprint, cache key and scan time.
+
+    When ``previous`` (the repo's record from the last cached scan) carries
+    the same cache key and its results were measured less than
+    ``CACHE_VALIDITY_SECONDS`` ago, they are reused with their original
+    ``scanned_at`` and the file-tree walks are skipped. The key cannot see
+    size changes below the repository root, so the age limit bounds how
+    stale reused sizes get. Results that fell back to defaults after an
+    error get no key, so the next scan retries them.
+    """
+    cache_key = _repo_cache_key(repo_path, git_info)
+    scanned_at = previous.get('scanned_at') if previous else None
+    if (
+        cache_key is not None
+        and previous
+        and previous.get('cache_key') == cache_key
+        and isinstance(scanned_at, (int, float))
+        and 0 <= time.time() - scanned_at < CACHE_VALIDITY_SECONDS
+        and 'reproducibility' in previous
+        and 'drift_footprint' in previous
+    ):
+        return (
+            previous['reproducibility'],
+            previous['drift_footprint'],
+            cache_key,
+            scanned_at,
+        )
+
+    try:
+        reproducibility = _check_reproducibility_health(repo_path)
+    except PROJECT_REPO_ERRORS as e:
+        logger.warning(f"Error checking reproducibility for {repo_path}: {e}")
+        cache_key = None
+        reproducibility = {
+            'environment_files': [],
+            'workflow_configs': [],
+            'missing_common_files': [],
+            'staleness': {},
+        }
+
+    try:
+        drift_footprint = _check_drift_and_footprint(repo_path)
+    except PROJECT_REPO_ERRORS as e:
+        logger.warning(f"Error checking drift/footprint for {repo_path}: {e}")
+        cache_key = None
+        drift_footprint = {
+            'directory_size': 0,
+            'git_size': 0,
+            'last_modified': None,
+            'last_commit': None,
+            'drift_days': None,
+            'large_untracked_files': [],
+        }
+
+    return reproducibility, drift_footprint, cache_key, time.time()
+
+
+def _process_repo(
+    repo_path: Path,
+    previous: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
     """
     Process a single repository and return project data.
     
     Args:
         repo_path: Path to git repository
+        previous: The repository's record from the last cached scan, if any
     
     Returns:
         Project data dict or None if processing fails
@@ -658,29 +927,9 @@ def _process_repo(repo_path: Path) -> dict[str, Any] | None:
             git_info['path'] = str(git_info['path'])
         
         # Get reproducibility and drift data with error handling
-        try:
-            reproducibility = _check_reproducibility_health(repo_path)
-        except PROJECT_REPO_ERRORS as e:
-            logger.warning(f"Error checking reproducibility for {repo_path}: {e}")
-            reproducibility = {
-                'environment_files': [],
-                'workflow_configs': [],
-                'missing_common_files': [],
-                'staleness': {},
-            }
-        
-        try:
-            drift_footprint = _check_drift_and_footprint(repo_path)
-        except PROJECT_REPO_ERRORS as e:
-            logger.warning(f"Error checking drift/footprint for {repo_path}: {e}")
-            drift_footprint = {
-                'directory_size': 0,
-                'git_size': 0,
-                'last_modified': None,
-                'last_commit': None,
-                'drift_days': None,
-                'large_untracked_files': [],
-            }
+        reproducibility, drift_footprint, cache_key, scanned_at = (
+            _repo_health(repo_path, git_info, previous)
+        )
         
         return {
             'name': git_info['name'],
@@ -688,6 +937,8 @@ def _process_repo(repo_path: Path) -> dict[str, Any] | None:
             'git': git_info,
             'reproducibility': reproducibility,
             'drift_footprint': drift_footprint,
+            'cache_key': cache_key,
+            'scanned_at': scanned_at,
         }
     except (PermissionError, OSError) as e:
         # Permission/authentication errors - skip this repo
@@ -699,18 +950,30 @@ def _process_repo(repo_path: Path) -> dict[str, Any] | None:
 
 
 def _load_projects_cache() -> dict[str, Any] | None:
-    """Load projects cache from file.
+    """Load projects cache from its gzip-compressed JSON file.
     
     Returns:
         Cache dict with 'timestamp', 'directories', and 'projects', or None if invalid
     """
-    if not PROJECTS_CACHE_FILE.exists():
+    try:
+        cache_mtime = PROJECTS_CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
         logger.debug("Projects cache file does not exist")
         return None
-    
+    except OSError as e:
+        logger.warning(f"Error checking projects cache: {e}")
+        return None
+
+    # The file is written once per save, so its mtime tracks the embedded
+    # timestamp; skip reading and decoding a cache that is already expired.
+    if time.time() - cache_mtime > CACHE_VALIDITY_SECONDS:
+        logger.info("Projects cache file expired; not loading it")
+        return None
+
     try:
-        with PROJECTS_CACHE_FILE.open('r', encoding='utf-8') as f:
-            cache = json.load(f)
+        cache = json_loads(
+            gzip.decompress(read_file_bytes(PROJECTS_CACHE_FILE))
+        )
         
         # Validate cache structure
         if not isinstance(cache, dict):
@@ -746,13 +1009,16 @@ def _load_projects_cache() -> dict[str, Any] | None:
     except json.JSONDecodeError as e:
         logger.warning(f"Error parsing projects cache JSON: {e}")
         return None
+    except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+        logger.warning(f"Projects cache is not valid gzip data: {e}")
+        return None
     except (OSError, TypeError) as e:
         logger.warning(f"Error loading projects cache: {e}", exc_info=True)
         return None
 
 
 def _save_projects_cache(projects_data: list[dict[str, Any]], directories: list[str]) -> None:
-    """Save projects cache to file.
+    """Save projects cache to file as gzip-compressed compact JSON.
     
     Args:
         projects_data: List of project data dictionaries
@@ -766,25 +1032,53 @@ def _save_projects_cache(projects_data: list[dict[str, Any]], directories: list[
             'directories': directories,
             'projects': projects_data,
         }
-        with PROJECTS_CACHE_FILE.open('w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        atomic_write_bytes(
+            PROJECTS_CACHE_FILE,
+            gzip.compress(
+                json_dumps_bytes(cache),
+                compresslevel=PROJECTS_CACHE_GZIP_LEVEL,
+                mtime=0,
+            ),
+        )
         logger.info(f"Saved projects cache: {len(projects_data)} projects from {len(directories)} directories")
+        _remove_legacy_projects_cache()
     except (OSError, TypeError) as e:
         logger.warning(f"Error saving projects cache: {e}")
 
 
+def _remove_legacy_projects_cache() -> None:
+    """Delete the old uncompressed projects cache once per worker."""
+    global _legacy_projects_cache_removed
+
+    if _legacy_projects_cache_removed:
+        return
+    try:
+        PROJECTS_CACHE_FILE.with_suffix('').unlink()
+        logger.info("Removed legacy uncompressed projects cache")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Could not remove legacy projects cache: %s", e)
+    _legacy_projects_cache_removed = True
+
+
 def _collect_projects_data(
     project_dirs: list[str],
     use_cache: bool = True,
+    reuse_repo_results: bool = True,
 ) -> tuple[list[dict[str, Any]], str | None]:
     """
     Collect project data from cache or by scanning directories.
     Scans configured directories so git state reflects the current filesystem.
-    Uses a valid cache only as a fallback when scanning fails.
+    Uses a valid cache as a fallback when scanning fails, and to skip the
+    file-tree checks of repositories whose HEAD, local changes, and
+    directory mtime are unchanged since it was written.
     
     Args:
         project_dirs: List of project directories to scan
         use_cache: Whether to use cache (default True)
+        reuse_repo_results: Whether unchanged repositories may reuse cached
+            reproducibility and drift results (default True)
     
     Returns:
         Tuple of (projects_data_list, error_message)
@@ -792,15 +1086,21 @@ def _collect_projects_data(
     # Normalize directory paths for comparison
     normalized_dirs = sorted([expand_path(d) for d in project_dirs])
     
-    # Load cache only as an error fallback. Returning it before a scan would
-    # hide new repos, deleted repos, branch changes, and dirty/clean state.
-    cached_data = None
-    if use_cache:
-        cached_data = _load_projects_cache()
-    
+    # The cache is never returned in place of a scan; that would hide new
+    # repos, deleted repos, branch changes, and dirty/clean state. Git state
+    # is always read live, and only per-repo health results are reused.
+    cached_data = _load_projects_cache() if use_cache else None
+    valid_projects = [
+        p for p in (cached_data or {}).get('projects', [])
+        if isinstance(p, dict) and 'path' in p
+    ]
+    previous = (
+        {p['path']: p for p in valid_projects} if reuse_repo_results else {}
+    )
+
     logger.info(f"Scanning {len(normalized_dirs)} project directories")
     try:
-        projects_data, error = _scan_directories(normalized_dirs)
+        projects_data, error = _scan_directories(normalized_dirs, previous)
         if use_cache:
             try:
                 _save_projects_cache(projects_data, normalized_dirs)
@@ -809,31 +1109,53 @@ def _collect_projects_data(
         return projects_data, error
     except PROJECT_REPO_ERRORS as e:
         logger.error(f"Error in _collect_projects_data: {e}", exc_info=True)
-        if cached_data:
-            cached_projects = cached_data.get('projects', [])
-            valid_projects = [
-                p for p in cached_projects
-                if isinstance(p, dict) and 'path' in p
-            ]
-            if valid_projects:
-                logger.warning(
-                    f"Returning {len(valid_projects)} cached projects after "
-                    f"scan failure: {e}"
-                )
-                return (
-                    valid_projects,
-                    f"Error collecting projects data: {str(e)}",
-                )
+        if valid_projects:
+            logger.warning(
+                f"Returning {len(valid_projects)} cached projects after "
+                f"scan failure: {e}"
+            )
+            return (
+                valid_projects,
+                f"Error collecting projects data: {str(e)}",
+            )
 
         return [], f"Error collecting projects data: {str(e)}"
 
 
+def _process_checker_repo(
+    repo_status: dict[str, Any],
+    repo_path: Path,
+    previous: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build one project record from a git-status-checker repository entry."""
+    git_info = _git_info_from_checker(repo_status, repo_path)
+    reproducibility, drift_footprint, cache_key, scanned_at = _repo_health(
+        repo_path, git_info, previous
+    )
+
+    return {
+        'name': git_info['name'],
+        'path': str(repo_path),
+        'git': git_info,
+        'reproducibility': reproducibility,
+        'drift_footprint': drift_footprint,
+        'cache_key': cache_key,
+        'scanned_at': scanned_at,
+    }
+
+
 def _process_checker_repos(
     checker_repos: list[dict[str, Any]],
+    previous: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[list[dict[str, Any]], list[str]]:
-    """Build project records from git-status-checker repository entries."""
+    """Build project records from git-status-checker repository entries.
+
+    ``previous`` maps repository paths to records from the last cached scan.
+    """
+    previous = previous or {}
     projects_data: list[dict[str, Any]] = []
     skipped: list[str] = []
+    pending: list[tuple[Path, dict[str, Any]]] = []
 
     for repo_status in checker_repos:
         raw_path = repo_status.get('path', '')
@@ -844,89 +1166,87 @@ def _process_checker_repos(
         if not repo_path.is_dir():
             skipped.append(raw_path)
             continue
+        pending.append((repo_path, repo_status))
 
-        try:
-            git_info = _git_info_from_checker(repo_status, repo_path)
-
-            try:
-                reproducibility = _check_reproducibility_health(repo_path)
-            except PROJECT_REPO_ERRORS:
-                reproducibility = {
-                    'environment_files': [],
-                    'workflow_configs': [],
-                    'missing_common_files': [],
-                    'staleness': {},
-                }
-
+    with ThreadPoolExecutor(max_workers=PROJECT_SCAN_WORKERS) as executor:
+        futures = [
+            (repo_path, executor.submit(
+                _process_checker_repo,
+                repo_status,
+                repo_path,
+                previous.get(str(repo_path)),
+            ))
+            for repo_path, repo_status in pending
+        ]
+        for repo_path, future in futures:
             try:
-                drift_footprint = _check_drift_and_footprint(repo_path)
-            except PROJECT_REPO_ERRORS:
-                drift_footprint = {
-                    'directory_size': 0,
-                    'git_size': 0,
-                    'last_modified': None,
-                    'last_commit': None,
-                    'drift_days': None,
-                    'large_untracked_files': [],
-                }
-
-            projects_data.append({
-                'name': git_info['name'],
-                'path': str(repo_path),
-                'git': git_info,
-                'reproducibility': reproducibility,
-                'drift_footprint': drift_footprint,
-            })
-        except PROJECT_REPO_ERRORS as exc:
-            logger.warning("Skipping %s: %s", repo_path, exc)
-            skipped.append(str(repo_path))
+                projects_data.append(future.result())
+            except PROJECT_REPO_ERRORS as exc:
+                logger.warning("Skipping %s: %s", repo_path, exc)
+                skipped.append(str(repo_path))
 
     return projects_data, skipped
 
 
 def _scan_directories_manual(
     project_dirs: list[str],
+    previous: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[list[dict[str, Any]], list[str]]:
     """Fallback scanner: walk directories and run git commands per repo."""
+    previous = previous or {}
     projects_data: list[dict[str, Any]] = []
     skipped: list[str] = []
 
     repos = _find_git_repos(project_dirs)
     logger.info("Manual scan found %d repositories", len(repos))
 
-    for repo_path in repos:
-        try:
-            project = _process_repo(repo_path)
-            if project:
-                projects_data.append(project)
-            else:
+    with ThreadPoolExecutor(max_workers=PROJECT_SCAN_WORKERS) as executor:
+        futures = [
+            (repo_path, executor.submit(
+                _process_repo, repo_path, previous.get(str(repo_path))
+            ))
+            for repo_path in repos
+        ]
+        for repo_path, future in futures:
+            try:
+                project = future.result()
+                if project:
+                    projects_data.append(project)
+                else:
+                    skipped.append(str(repo_path))
+            except PROJECT_REPO_ERRORS as exc:
+                logger.warning("Error processing %s: %s", repo_path, exc)
                 skipped.append(str(repo_path))
-        except PROJECT_REPO_ERRORS as exc:
-            logger.warning("Error processing %s: %s", repo_path, exc)
-            skipped.append(str(repo_path))
 
     return projects_data, skipped
 
 
 def _scan_directories(
     project_dirs: list[str],
+    previous: dict[str, dict[str, Any]] | None = None,
 ) -> tuple[list[dict[str, Any]], str | None]:
     """Scan directories for git repositories and collect project data.
 
     Tries git-status-checker first (single process, bulk scan). Falls back
     to manual per-repo git commands when the binary is unavailable.
+    ``previous`` maps repository paths to records from the last cached scan
+    whose health results may be reused.
     """
     checker_repos, checker_error = _call_git_status_checker(project_dirs)
 
     if checker_repos:
-        projects_data, skipped = _process_checker_repos(checker_repos)
+        projects_data, skipped = _process_checker_repos(
+            checker_repos, previous
+        )
     else:
         if checker_error:
             logger.info(
                 "git-status-checker unavailable (%s); using manual scan",
                 checker_error,
             )
-        projects_data, skipped = _scan_directories_manual(project_dirs)
+        projects_data, skipped = _scan_directories_manual(
+            project_dirs, previous
+        )
 
     if not projects_data and not skipped:
         return [], (
@@ -957,10 +1277,10 @@ def projects():
     Render the projects page immediately.
     Data is loaded asynchronously via JavaScript to avoid timeouts.
     """
-    logger.info("Projects page accessed")
+    logger.debug("Projects page accessed")
     settings = load_settings()
     project_dirs = settings.get(PROJECT_DIRS_CONFIG_KEY, [])
-    logger.info(f"Loaded project directories from settings: {project_dirs}")
+    logger.debug("Loaded project directories from settings: %s", project_dirs)
     
     if not project_dirs:
         logger.warning("No project directories configured")
@@ -1029,11 +1349,13 @@ def projects_status():
                 }), 200
             validated_project_dirs.append(str(validated_directory))
 
-        logger.info(
-            f"Processing {len(validated_project_dirs)} project directories: "
-            f"{validated_project_dirs}"
+        logger.debug(
+            "Processing %d project directories: %s",
+            len(validated_project_dirs),
+            validated_project_dirs,
         )
-        # Projects always scans live. Refresh keeps cache fallback/update enabled.
+        # Projects always scans live. Refresh keeps cache fallback/update
+        # enabled but re-runs every repository's file-tree checks.
         force_refresh = request.args.get('refresh', '').lower() == 'true'
         if force_refresh:
             logger.info("Project refresh requested; scanning live and updating cache")
@@ -1042,6 +1364,7 @@ def projects_status():
             projects_data, error = _collect_projects_data(
                 validated_project_dirs,
                 use_cache=True,
+                reuse_repo_results=not force_refresh,
             )
         except PROJECT_REPO_ERRORS as collect_err:
             logger.error(
@@ -1054,9 +1377,13 @@ def projects_status():
                 'error': f'Error collecting projects: {str(collect_err)}',
             }), 500
         
+        projects = [
+            {k: v for k, v in project.items() if k not in _CACHE_ONLY_FIELDS}
+            for project in projects_data
+        ]
         return jsonify({
-            'projects': projects_data,
-            'total': len(projects_data),
+            'projects': projects,
+            'total': len(projects),
             'error': error,
         }), 200
     except PROJECT_REPO_ERRORS as e:
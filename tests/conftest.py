@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
@@ -30,3 +32,15 @@ def app() -> Flask:
 def client(app: Flask) -> FlaskClient:
     """Flask test client bound to the test application."""
     return app.test_client()
+
+
+@pytest.fixture
+def clean_modules_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start from an empty module cache and restore the globals afterwards."""
+    from blueprints import modules as modules_blueprint
+
+    for name in ("_modules_snapshot", "_modules_source_key"):
+        monkeypatch.setattr(modules_blueprint, name, None)
+    monkeypatch.setattr(
+        modules_blueprint, "_modules_cache_ready", threading.Event()
+    )
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
+
+from blueprints import jobs as jobs_blueprint
 from blueprints.jobs import (
+    _load_partition_metadata,
     _parse_sacct_output,
     _parse_sinfo_output,
     _parse_squeue_output,
@@ -65,3 +69,54 @@ def test_parse_time_to_seconds_handles_hms_and_day_formats() -> None:
     assert _parse_time_to_seconds("01:30:00") == 5400
     assert _parse_time_to_seconds("1-02:00:00") == 93600
     assert _parse_time_to_seconds("N/A") == 0
+
+
+def test_load_partition_metadata_reuses_parse_within_ttl(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    metadata_file = tmp_path / "partition_metadata.json"
+    metadata_file.write_text(
+        json.dumps({"express": {"category": "Short"}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(jobs_blueprint, "PARTITION_METADATA_FILE", metadata_file)
+    monkeypatch.setattr(jobs_blueprint, "_partition_metadata", None)
+    monkeypatch.setattr(jobs_blueprint, "_partition_metadata_key", None)
+    monkeypatch.setattr(jobs_blueprint, "_partition_metadata_checked", 0.0)
+
+    first = _load_partition_metadata()
+    metadata_file.write_text(
+        json.dumps({"express": {"category": "Long"}, "gpu": {}}),
+        encoding="utf-8",
+    )
+
+    assert _load_partition_metadata() is first
+
+    monkeypatch.setattr(jobs_blueprint, "PARTITION_METADATA_TTL", 0)
+
+    assert _load_partition_metadata()["express"]["category"] == "Long"
+
+
+def test_seff_cache_reuses_parse_until_file_changes(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    cache_file = tmp_path / "seff_cache.json"
+    monkeypatch.setattr(jobs_blueprint, "SEFF_CACHE_FILE", cache_file)
+    monkeypatch.setattr(jobs_blueprint, "_seff_cache", None)
+
+    assert jobs_blueprint._load_seff_cache() == {}
+
+    jobs_blueprint._cache_seff_result("101", "Job ID: 101", None)
+    first = jobs_blueprint._load_seff_cache()
+
+    assert first["101"]["output"] == "Job ID: 101"
+    assert jobs_blueprint._load_seff_cache() is first
+
+    jobs_blueprint._cache_seff_result("102", None, "seff failed")
+    second = jobs_blueprint._load_seff_cache()
+
+    assert sorted(second) == ["101", "102"]
+    # Saving works on a copy, so the earlier shared parse is untouched
+    assert sorted(first) == ["101"]
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+
+from blueprints import modules as modules_blueprint
 from blueprints.modules import (
     _categorize_module,
+    _load_categories,
+    _load_descriptions_cache,
+    _module_base_name,
     _natural_sort_key,
+    _parse_lua_table,
     _parse_spider_cache,
+    _read_spider_modules,
 )
 
 
@@ -19,6 +28,13 @@ def test_natural_sort_key_orders_numeric_versions() -> None:
     assert versions == ["item/1.0", "item/2.0", "item/10.0"]
 
 
+def test_module_base_name_strips_only_the_version() -> None:
+    assert _module_base_name("Python", ["Python/3.11"]) == "Python"
+    assert _module_base_name("R", ["rc/R/4.3.1"]) == "rc/R"
+    assert _module_base_name("tool", ["tool"]) == "tool"
+    assert _module_base_name("tool", []) == "tool"
+
+
 def test_categorize_module_uses_exact_and_prefix_matches() -> None:
     categories = {
         "Armadillo": "Math/Libraries",
@@ -34,6 +50,29 @@ def test_categorize_module_uses_exact_and_prefix_matches() -> None:
     assert _categorize_module("unknown-module", categories) == "Misc"
 
 
+def test_parse_lua_table_handles_scalars_escapes_and_comments() -> None:
+    text = (
+        '{\n'
+        '  -- generated by Lmod\n'
+        '  ["gcc/12"] = { Version = "12", size = -1.5e3, hidden = false },\n'
+        '  help = "say \\"hi\\"",\n'
+        '  count = 42, flag = true,\n'
+        "  whatis = { 'first', \"second\" },\n"
+        '}'
+    )
+
+    table, pos = _parse_lua_table(text, 0)
+
+    assert pos == len(text)
+    assert table == {
+        "gcc/12": {"Version": "12", "size": -1500.0, "hidden": False},
+        "help": 'say \\"hi\\"',
+        "count": 42,
+        "flag": True,
+        "whatis": ["first", "second"],
+    }
+
+
 SAMPLE_SPIDER_LUA = """\
 spiderT = {
   ["/apps/modules/all"] = {
@@ -81,3 +120,166 @@ def test_parse_spider_cache_returns_none_for_missing_file(
 ) -> None:
     result = _parse_spider_cache(tmp_path / "nonexistent.lua")
     assert result is None
+
+
+def test_categories_file_is_parsed_once_until_it_changes(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    categories_file = tmp_path / "module_categories.json"
+    categories_file.write_text(
+        json.dumps({"gcc": "Compilers", "descriptions": {"gcc": "GNU"}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(modules_blueprint, "CATEGORIES_FILE", categories_file)
+    monkeypatch.setattr(modules_blueprint, "_categories_file_cache", None)
+
+    parses = []
+    real_loads = modules_blueprint.json_loads
+
+    def counting_loads(data):
+        parses.append(True)
+        return real_loads(data)
+
+    monkeypatch.setattr(modules_blueprint, "json_loads", counting_loads)
+
+    assert _load_categories() == {"gcc": "Compilers"}
+    assert _load_descriptions_cache() == {"gcc": "GNU"}
+    assert len(parses) == 1
+
+    categories_file.write_text(
+        json.dumps({"gcc": "Toolchains", "descriptions": {}}),
+        encoding="utf-8",
+    )
+
+    assert _load_categories() == {"gcc": "Toolchains"}
+    assert len(parses) == 2
+
+
+def test_read_spider_modules_reuses_snapshot_until_source_changes(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    lua_file = tmp_path / "spiderT.lua"
+    lua_file.write_text(SAMPLE_SPIDER_LUA)
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULES_SNAPSHOT_FILE",
+        tmp_path / "snapshot.pickle",
+    )
+
+    parses = []
+    real_parse = modules_blueprint._parse_spider_cache
+
+    def counting_parse(cache_path):
+        parses.append(cache_path)
+        return real_parse(cache_path)
+
+    monkeypatch.setattr(
+        modules_blueprint,
+        "_parse_spider_cache",
+        counting_parse,
+    )
+
+    first = _read_spider_modules(lua_file)
+    second = _read_spider_modules(lua_file)
+
+    assert first == second
+    assert second["gcc"]["versions"] == ["gcc/11.4.0", "gcc/12.2.0"]
+    assert len(parses) == 1
+
+    lua_file.write_text(SAMPLE_SPIDER_LUA.replace("CUDA", "cuda"))
+    third = _read_spider_modules(lua_file)
+
+    assert "cuda" in third
+    assert len(parses) == 2
+
+
+def test_revalidation_skips_rebuild_when_sources_unchanged(
+    tmp_path: Path,
+    monkeypatch,
+    clean_modules_cache,
+) -> None:
+    lua_file = tmp_path / "spiderT.lua"
+    lua_file.write_text(SAMPLE_SPIDER_LUA)
+    categories_file = tmp_path / "module_categories.json"
+    categories_file.write_text(json.dumps({"gcc": "Compilers"}))
+
+    monkeypatch.setenv(modules_blueprint.SPIDER_CACHE_ENV_VAR, str(lua_file))
+    monkeypatch.setattr(modules_blueprint, "CATEGORIES_FILE", categories_file)
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULES_SNAPSHOT_FILE",
+        tmp_path / "snapshot.pickle",
+    )
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULE_REFRESH_LOCK_FILE",
+        tmp_path / "refresh.lock",
+    )
+    monkeypatch.setattr(modules_blueprint, "_categories_file_cache", None)
+
+    builds = []
+    real_build = modules_blueprint._module_records_from_spider_data
+
+    def counting_build(modules_dict):
+        builds.append(True)
+        return real_build(modules_dict)
+
+    monkeypatch.setattr(
+        modules_blueprint,
+        "_module_records_from_spider_data",
+        counting_build,
+    )
+
+    modules_blueprint._revalidate_modules_cache()
+    first_snapshot = modules_blueprint._modules_snapshot
+    modules_blueprint._revalidate_modules_cache()
+    snapshot = modules_blueprint._modules_snapshot
+
+    assert len(builds) == 1
+    assert [m["name"] for m in snapshot[0]] == ["CUDA", "gcc"]
+    assert snapshot[2] >= first_snapshot[2]
+    assert snapshot[7] == first_snapshot[7]
+    assert snapshot[8] == first_snapshot[8]
+
+    categories_file.write_text(json.dumps({"gcc": "Toolchains"}))
+    modules_blueprint._revalidate_modules_cache()
+
+    assert len(builds) == 2
+
+
+def test_keep_modules_cache_warm_revalidates_before_ttl(monkeypatch) -> None:
+    calls = []
+
+    class StopLoop(Exception):
+        pass
+
+    def fake_sleep(seconds: float) -> None:
+        calls.append(("sleep", seconds))
+        if len(calls) > 3:
+            raise StopLoop
+
+    monkeypatch.setattr(
+        modules_blueprint,
+        "_preload_modules_cache",
+        lambda: calls.append(("preload",)),
+    )
+    monkeypatch.setattr(
+        modules_blueprint,
+        "_load_modules_cache",
+        lambda skip_if_cached: calls.append(("load", skip_if_cached)),
+    )
+    monkeypatch.setattr(modules_blueprint.time, "sleep", fake_sleep)
+
+    with pytest.raises(StopLoop):
+        modules_blueprint._keep_modules_cache_warm()
+
+    interval = modules_blueprint.MODULES_KEEP_WARM_INTERVAL
+    assert interval < modules_blueprint.MODULES_CACHE_TTL
+    assert calls == [
+        ("preload",),
+        ("sleep", interval),
+        ("load", False),
+        ("sleep", interval),
+    ]
@@ -0,0 +1,517 @@
+"""Tests for project cache and scanning helpers in projects blueprint."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from blueprints import projects as projects_blueprint
+from blueprints.projects import _load_projects_cache, _save_projects_cache
+
+
+def test_projects_cache_round_trip(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "projects_cache.json.gz"
+    monkeypatch.setattr(projects_blueprint, "PROJECTS_CACHE_FILE", cache_file)
+
+    _save_projects_cache([{"name": "demo", "path": "/tmp/demo"}], ["/tmp"])
+    cache = _load_projects_cache()
+
+    assert cache is not None
+    assert cache["projects"] == [{"name": "demo", "path": "/tmp/demo"}]
+    assert cache["directories"] == ["/tmp"]
+    assert json.loads(gzip.decompress(cache_file.read_bytes()))["projects"] == [
+        {"name": "demo", "path": "/tmp/demo"}
+    ]
+
+
+def test_save_projects_cache_removes_legacy_json_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "projects_cache.json.gz"
+    legacy_file = tmp_path / "projects_cache.json"
+    legacy_file.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(projects_blueprint, "PROJECTS_CACHE_FILE", cache_file)
+    monkeypatch.setattr(
+        projects_blueprint, "_legacy_projects_cache_removed", False
+    )
+
+    _save_projects_cache([], ["/tmp"])
+
+    assert cache_file.exists()
+    assert not legacy_file.exists()
+
+    legacy_file.write_text("{}", encoding="utf-8")
+    _save_projects_cache([], ["/tmp"])
+
+    # Only the first save in a worker looks for the legacy file
+    assert legacy_file.exists()
+
+
+def test_load_projects_cache_rejects_corrupt_gzip(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "projects_cache.json.gz"
+    cache_file.write_bytes(gzip.compress(b'{"projects": []}')[:-6])
+    monkeypatch.setattr(projects_blueprint, "PROJECTS_CACHE_FILE", cache_file)
+
+    assert _load_projects_cache() is None
+
+
+def test_load_projects_cache_skips_expired_file_without_reading(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "projects_cache.json.gz"
+    # A valid payload whose embedded timestamp is still fresh: only the
+    # file's expired mtime can make the loader reject it
+    cache_file.write_bytes(
+        gzip.compress(json.dumps({
+            "schema_version": projects_blueprint.PROJECTS_CACHE_SCHEMA_VERSION,
+            "timestamp": time.time(),
+            "directories": [str(tmp_path)],
+            "projects": [],
+        }).encode("utf-8"))
+    )
+    expired = time.time() - projects_blueprint.CACHE_VALIDITY_SECONDS - 60
+    os.utime(cache_file, (expired, expired))
+    monkeypatch.setattr(projects_blueprint, "PROJECTS_CACHE_FILE", cache_file)
+
+    def fail_read(path: object) -> bytes:
+        raise AssertionError("expired cache should not be read")
+
+    monkeypatch.setattr(projects_blueprint, "read_file_bytes", fail_read)
+
+    assert _load_projects_cache() is None
+
+
+def test_collect_projects_data_falls_back_to_cache_on_scan_failure(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "projects_cache.json.gz"
+    cache_file.write_bytes(
+        gzip.compress(json.dumps({
+            "schema_version": projects_blueprint.PROJECTS_CACHE_SCHEMA_VERSION,
+            "timestamp": time.time(),
+            "directories": [str(tmp_path)],
+            "projects": [{"name": "cached", "path": "/tmp/cached"}],
+        }).encode("utf-8"))
+    )
+    monkeypatch.setattr(projects_blueprint, "PROJECTS_CACHE_FILE", cache_file)
+    loads: list[bool] = []
+    original_load = projects_blueprint._load_projects_cache
+
+    def counting_load() -> dict[str, object] | None:
+        loads.append(True)
+        return original_load()
+
+    monkeypatch.setattr(
+        projects_blueprint, "_load_projects_cache", counting_load
+    )
+    monkeypatch.setattr(
+        projects_blueprint,
+        "_save_projects_cache",
+        lambda projects_data, directories: None,
+    )
+    scans: list[dict[str, object]] = []
+
+    def live_scan(dirs: list[str], previous: dict[str, object]):
+        scans.append(previous)
+        return [{"name": "live", "path": "/tmp/live"}], None
+
+    monkeypatch.setattr(projects_blueprint, "_scan_directories", live_scan)
+
+    projects_data, error = projects_blueprint._collect_projects_data(
+        [str(tmp_path)]
+    )
+    assert [p["name"] for p in projects_data] == ["live"]
+    assert error is None
+    assert list(scans[0]) == ["/tmp/cached"]
+
+    projects_data, error = projects_blueprint._collect_projects_data(
+        [str(tmp_path)], reuse_repo_results=False
+    )
+    assert scans[1] == {}
+
+    def failing_scan(dirs: list[str], previous: dict[str, object]) -> None:
+        raise OSError("scan failed")
+
+    monkeypatch.setattr(projects_blueprint, "_scan_directories", failing_scan)
+
+    projects_data, error = projects_blueprint._collect_projects_data(
+        [str(tmp_path)]
+    )
+    assert [p["name"] for p in projects_data] == ["cached"]
+    assert error is not None and "scan failed" in error
+    # One load per collection serves both reuse and the fallback
+    assert loads == [True, True, True]
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("## main", ("main", None)),
+        ("## main...origin/main", ("main", (0, 0))),
+        ("## main...origin/main [ahead 2]", ("main", (2, 0))),
+        ("## dev...upstream/dev [ahead 1, behind 3]", ("dev", (1, 3))),
+        ("## main...origin/main [gone]", ("main", None)),
+        ("## HEAD (no branch)", ("HEAD", None)),
+        ("## No commits yet on main", ("main", None)),
+    ],
+)
+def test_parse_status_branch_header(
+    header: str,
+    expected: tuple[str | None, tuple[int, int] | None],
+) -> None:
+    assert projects_blueprint._parse_status_branch_header(header) == expected
+
+
+def test_get_git_info_reads_branch_and_counts_from_status(
+    tmp_path: Path,
+) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "main")
+    _git(origin, "commit", "-q", "--allow-empty", "-m", "initial")
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", str(origin), str(clone))
+    _git(clone, "commit", "-q", "--allow-empty", "-m", "local")
+    (clone / "notes.txt").write_text("draft", encoding="utf-8")
+
+    git_info = projects_blueprint._get_git_info(clone)
+
+    assert git_info is not None
+    assert git_info["branch"] == "main"
+    assert git_info["ahead"] is True
+    assert git_info["behind"] is False
+    assert git_info["dirty"] is True
+    assert git_info["local_changes"] == ["?? notes.txt"]
+    assert git_info["up_to_date"] is False
+    assert git_info["remote"] == str(origin)
+
+
+def test_manual_scan_processes_repos_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repos = [Path("/tmp/a"), Path("/tmp/b"), Path("/tmp/missing")]
+    # Both live repos must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_process_repo(
+        repo_path: Path,
+        previous: dict[str, object] | None,
+    ) -> dict[str, str] | None:
+        if repo_path.name == "missing":
+            return None
+        barrier.wait()
+        return {"name": repo_path.name, "path": str(repo_path)}
+
+    monkeypatch.setattr(projects_blueprint, "PROJECT_SCAN_WORKERS", 2)
+    monkeypatch.setattr(projects_blueprint, "_find_git_repos", lambda dirs: repos)
+    monkeypatch.setattr(projects_blueprint, "_process_repo", fake_process_repo)
+
+    projects_data, skipped = projects_blueprint._scan_directories_manual(["/tmp"])
+
+    assert [p["name"] for p in projects_data] == ["a", "b"]
+    assert skipped == ["/tmp/missing"]
+
+
+def test_git_info_from_checker_reads_branch_commit_and_upstream_remote(
+    tmp_path: Path,
+) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "feature")
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "initial")
+    _git(repo, "remote", "add", "origin", "https://example.com/origin.git")
+    _git(repo, "remote", "add", "fork", "https://example.com/fork.git")
+    _git(repo, "config", "branch.feature.remote", "fork")
+
+    git_info = projects_blueprint._git_info_from_checker(
+        {"local_changes": [], "up_to_date": True}, repo
+    )
+
+    assert git_info["branch"] == "feature"
+    assert git_info["last_commit_author"] == "t"
+    assert len(git_info["last_commit"]) == 8
+    assert git_info["remote"] == "https://example.com/fork.git"
+
+    _git(repo, "checkout", "-q", "--detach")
+    git_info = projects_blueprint._git_info_from_checker({}, repo)
+
+    assert git_info["branch"] == "HEAD"
+    assert git_info["remote"] == "https://example.com/origin.git"
+
+
+def test_find_git_repos_stops_at_repo_roots(tmp_path: Path) -> None:
+    for repo in ("alpha", "group/beta", "group/beta/vendor/nested", ".hidden/gamma"):
+        (tmp_path / repo / ".git").mkdir(parents=True)
+    (tmp_path / "plain" / "src").mkdir(parents=True)
+    # A .git file (worktree/submodule pointer) is not treated as a repo
+    (tmp_path / "plain" / ".git").write_text("gitdir: elsewhere", encoding="utf-8")
+    (tmp_path / "link").symlink_to(tmp_path / "group", target_is_directory=True)
+
+    repos = projects_blueprint._find_git_repos([str(tmp_path)])
+
+    assert sorted(repos) == [tmp_path / "alpha", tmp_path / "group" / "beta"]
+
+
+def test_measure_repo_tree_splits_work_tree_and_git_sizes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / ".git" / "objects").mkdir(parents=True)
+    (tmp_path / ".git" / "objects" / "pack").write_bytes(b"x" * 10)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_bytes(b"y" * 4)
+    (tmp_path / "README.md").write_bytes(b"z" * 2)
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "big.bin").write_bytes(b"v" * 100)
+    (tmp_path / "src-link").symlink_to(tmp_path / "src", target_is_directory=True)
+    os.utime(tmp_path / "src" / "main.py", (1_000_000, 1_000_000))
+    os.utime(tmp_path / "README.md", (2_000_000, 2_000_000))
+
+    monkeypatch.setattr(projects_blueprint, "LARGE_FILE_BYTES", 3)
+
+    total_size, git_size, last_modified, large_files = (
+        projects_blueprint._measure_repo_tree(tmp_path)
+    )
+
+    assert (total_size, git_size, last_modified) == (6, 10, 2_000_000)
+    assert large_files == {"src/main.py": 4}
+
+
+def test_parse_porcelain_v2_paths() -> None:
+    output = "\0".join([
+        "1 .M N... 100644 100644 100644 abc abc src/app.py",
+        "2 R. N... 100644 100644 100644 abc abc R100 new name.txt",
+        "old name.txt",
+        "u UU N... 100644 100644 100644 100644 a b c conflict.txt",
+        "? untracked.txt",
+        "",
+    ])
+
+    assert projects_blueprint._parse_porcelain_v2_paths(output) == [
+        "src/app.py",
+        "new name.txt",
+        "conflict.txt",
+    ]
+
+
+def test_staleness_reports_only_changed_tracked_files(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "clean.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "edited.txt").write_text("a", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    future = time.time() + 3600
+    (tmp_path / "edited.txt").write_text("b", encoding="utf-8")
+    for name in ("clean.txt", "edited.txt"):
+        os.utime(tmp_path / name, (future, future))
+
+    staleness = projects_blueprint._check_reproducibility_health(tmp_path)[
+        "staleness"
+    ]
+
+    assert [f["path"] for f in staleness["files_modified_after_commit"]] == [
+        "edited.txt"
+    ]
+    assert staleness["count"] == 1
+
+
+def test_drift_and_footprint_runs_git_status_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "tracked.txt").write_text("a", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "big.bin").write_bytes(b"\0" * (2 * 1024 * 1024))
+    (tmp_path / "data" / "small.bin").write_bytes(b"\0" * 10)
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / ".cache" / "blob é.bin").write_bytes(b"\0" * (3 * 1024 * 1024))
+    future = time.time() + 2 * 86400
+    os.utime(tmp_path / "data" / "big.bin", (future, future))
+
+    commands: list[list[str]] = []
+    original_run = subprocess.run
+
+    def recording_run(cmd: list[str], *args: object, **kwargs: object):
+        commands.append(cmd)
+        return original_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(projects_blueprint.subprocess, "run", recording_run)
+
+    info = projects_blueprint._check_drift_and_footprint(tmp_path)
+
+    assert [cmd[1] for cmd in commands].count("status") == 1
+    assert [f["path"] for f in info["large_untracked_files"]] == [
+        ".cache/blob é.bin",
+        "data/big.bin",
+    ]
+    assert info["drift_days"] is not None and info["drift_days"] >= 1
+
+
+def test_call_git_status_checker_parses_byte_output(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checker = tmp_path / "git-status-checker"
+    report = json.dumps(
+        {"repositories": [{"path": str(tmp_path), "local_changes": ["ü.txt"]}]},
+        ensure_ascii=False,
+    )
+    checker.write_text(
+        f"#!/bin/sh\ncat <<'EOF'\n{report}\nEOF\necho warning >&2\nexit 1\n",
+        encoding="utf-8",
+    )
+    checker.chmod(0o755)
+    monkeypatch.setattr(
+        projects_blueprint, "_find_checker_binary", lambda: str(checker)
+    )
+
+    repos, error = projects_blueprint._call_git_status_checker([str(tmp_path)])
+
+    assert error is None
+    assert repos == [{"path": str(tmp_path), "local_changes": ["ü.txt"]}]
+
+    checker.write_text("#!/bin/sh\necho '{not json'\n", encoding="utf-8")
+    repos, error = projects_blueprint._call_git_status_checker([str(tmp_path)])
+
+    assert repos == []
+    assert error is not None and "JSON parse error" in error
+
+
+def test_process_repo_reuses_health_results_for_unchanged_repo(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "initial")
+    first = projects_blueprint._process_repo(tmp_path)
+    assert first is not None and first["cache_key"]
+
+    def fail_walk(repo_path: Path) -> None:
+        raise AssertionError("unchanged repo should reuse cached results")
+
+    monkeypatch.setattr(
+        projects_blueprint, "_check_drift_and_footprint", fail_walk
+    )
+    second = projects_blueprint._process_repo(tmp_path, first)
+
+    assert second is not None
+    assert second["drift_footprint"] == first["drift_footprint"]
+    assert second["cache_key"] == first["cache_key"]
+    # Reuse keeps the original scan time so re-saved records still age out
+    assert second["scanned_at"] == first["scanned_at"]
+
+    monkeypatch.undo()
+    (tmp_path / "new.txt").write_text("change", encoding="utf-8")
+    third = projects_blueprint._process_repo(tmp_path, first)
+
+    assert third is not None
+    assert third["cache_key"] != first["cache_key"]
+
+
+def test_process_repo_rescans_expired_results_for_unchanged_repo(
+    tmp_path: Path,
+) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "data.txt").write_text("0123456789", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    (tmp_path / "data.txt").write_text("changed", encoding="utf-8")
+    first = projects_blueprint._process_repo(tmp_path)
+    assert first is not None
+    assert first["drift_footprint"]["directory_size"] == 7
+
+    # An already-modified file grows: the key cannot see it
+    (tmp_path / "data.txt").write_text("changed" * 100, encoding="utf-8")
+    reused = projects_blueprint._process_repo(tmp_path, first)
+    assert reused is not None
+    assert reused["drift_footprint"]["directory_size"] == 7
+
+    expired = {
+        **first,
+        "scanned_at": first["scanned_at"]
+        - projects_blueprint.CACHE_VALIDITY_SECONDS
+        - 1,
+    }
+    rescanned = projects_blueprint._process_repo(tmp_path, expired)
+
+    assert rescanned is not None
+    assert rescanned["drift_footprint"]["directory_size"] == 700
+    assert rescanned["scanned_at"] > expired["scanned_at"]
+
+
+def test_find_checker_binary_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def fake_which(name: str) -> str:
+        lookups.append(name)
+        return "/opt/bin/git-status-checker"
+
+    monkeypatch.setattr(projects_blueprint.shutil, "which", fake_which)
+    projects_blueprint._find_checker_binary.cache_clear()
+    try:
+        assert projects_blueprint._find_checker_binary() == (
+            "/opt/bin/git-status-checker"
+        )
+        assert projects_blueprint._find_checker_binary() == (
+            "/opt/bin/git-status-checker"
+        )
+        assert lookups == ["git-status-checker"]
+    finally:
+        projects_blueprint._find_checker_binary.cache_clear()
+
+
+def test_find_git_repos_probes_but_skips_noise_directories(tmp_path: Path) -> None:
+    (tmp_path / "app" / "node_modules" / "pkg" / ".git").mkdir(parents=True)
+    (tmp_path / "build" / ".git").mkdir(parents=True)
+    (tmp_path / "venv" / "lib" / "vendored" / ".git").mkdir(parents=True)
+
+    repos = projects_blueprint._find_git_repos([str(tmp_path)])
+
+    assert repos == [tmp_path / "build"]
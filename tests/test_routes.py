@@ -6,6 +6,7 @@ import json
 from unittest.mock import patch
 
 import utils
+from blueprints import modules as modules_blueprint
 
 
 def test_settings_page_renders(client) -> None:
@@ -38,6 +39,88 @@ def test_modules_list_returns_json(client) -> None:
     assert "modules" in payload
 
 
+def test_modules_list_serves_cached_body_with_etag(
+    client,
+    clean_modules_cache,
+) -> None:
+    modules_blueprint._store_modules_cache([
+        {
+            "name": "gcc",
+            "versions": ["gcc/12.2.0"],
+            "description": "GNU Compiler Collection",
+            "category": "Compilers/Toolchains",
+        }
+    ])
+
+    response = client.get("/modules/list")
+    payload = response.get_json()
+
+    assert response.status_code == 200
+    assert payload["unique_count"] == 1
+    assert payload["category_order"] == ["Compilers/Toolchains"]
+    assert response.headers["ETag"]
+    assert response.cache_control.private
+    assert 0 < response.cache_control.max_age <= (
+        modules_blueprint.MODULES_CACHE_TTL
+    )
+    assert "stale-while-revalidate=" in response.headers["Cache-Control"]
+
+    cached_response = client.get(
+        "/modules/list",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert cached_response.status_code == 304
+    assert cached_response.data == b""
+
+    since_response = client.get(
+        "/modules/list",
+        headers={"If-Modified-Since": response.headers["Last-Modified"]},
+    )
+    assert since_response.status_code == 304
+
+    columns_response = client.get("/modules/list?format=columns")
+    columns_payload = columns_response.get_json()
+    assert columns_payload["names"] == ["gcc"]
+    assert columns_payload["versions"] == [["gcc/12.2.0"]]
+    assert columns_payload["categories"] == [0]
+    assert columns_payload["category_order"] == ["Compilers/Toolchains"]
+    assert columns_response.headers["ETag"] != response.headers["ETag"]
+    assert client.get("/modules/list?format=xml").status_code == 400
+
+    page_response = client.get("/modules/")
+    assert page_response.status_code == 200
+    assert b"Compilers/Toolchains" in page_response.data
+
+
+def test_modules_list_reads_body_and_etag_from_one_snapshot(
+    client,
+    clean_modules_cache,
+) -> None:
+    import hashlib
+
+    record = {
+        "name": "gcc",
+        "versions": ["gcc/12.2.0"],
+        "description": "GNU Compiler Collection",
+        "category": "Compilers/Toolchains",
+    }
+    modules_blueprint._store_modules_cache([record])
+    first_snapshot = modules_blueprint._modules_snapshot
+    modules_blueprint._store_modules_cache([record, {**record, "name": "zlib"}])
+
+    # The earlier snapshot is untouched by the later store
+    assert modules_blueprint._modules_snapshot is not first_snapshot
+    assert [m["name"] for m in first_snapshot[0]] == ["gcc"]
+    assert first_snapshot[1][1] == ["Compilers/Toolchains"]
+    assert first_snapshot[7] == hashlib.blake2b(
+        first_snapshot[3], digest_size=8
+    ).hexdigest()
+
+    response = client.get("/modules/list")
+    digest = hashlib.blake2b(response.data, digest_size=8).hexdigest()
+    assert response.headers["ETag"] == f'"modules-records-{digest}"'
+
+
 def test_csrf_protects_module_refresh_start(client) -> None:
     rejected_response = client.post("/modules/refresh-start")
     assert rejected_response.status_code == 400
@@ -52,6 +135,240 @@ def test_csrf_protects_module_refresh_start(client) -> None:
     assert accepted_response.status_code == 200
 
 
+def test_modules_list_serves_precompressed_gzip(
+    client,
+    clean_modules_cache,
+) -> None:
+    import gzip
+
+    modules_blueprint._store_modules_cache([
+        {
+            "name": "gcc",
+            "versions": ["gcc/12.2.0"],
+            "description": "GNU Compiler Collection",
+            "category": "Compilers/Toolchains",
+        }
+    ])
+
+    plain = client.get("/modules/list")
+    compressed = client.get(
+        "/modules/list",
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+    refused = client.get(
+        "/modules/list",
+        headers={"Accept-Encoding": "gzip;q=0"},
+    )
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+    assert "Content-Encoding" not in refused.headers
+
+
+def test_stale_modules_cache_is_served_while_revalidating(
+    app,
+    client,
+    monkeypatch,
+    clean_modules_cache,
+) -> None:
+    revalidations = []
+
+    class ImmediateThread:
+        def __init__(self, target, name, daemon):
+            self.target = target
+
+        def start(self) -> None:
+            self.target()
+
+    app.config.update(TESTING=False, START_BACKGROUND_THREADS=True)
+    monkeypatch.setattr(modules_blueprint.threading, "Thread", ImmediateThread)
+    monkeypatch.setattr(
+        modules_blueprint,
+        "_revalidate_modules_cache",
+        lambda: revalidations.append(True),
+    )
+    monkeypatch.setattr(modules_blueprint, "_last_revalidation_start", None)
+    modules_blueprint._store_modules_cache([])
+    snapshot = modules_blueprint._modules_snapshot
+    stale_timestamp = (
+        modules_blueprint.time.time() - modules_blueprint.MODULES_CACHE_TTL - 1
+    )
+    modules_blueprint._modules_snapshot = (
+        *snapshot[:2], stale_timestamp, *snapshot[3:]
+    )
+
+    stale_response = client.get("/modules/list")
+    throttled_response = client.get("/modules/list")
+
+    assert stale_response.status_code == 200
+    assert stale_response.headers["X-Cache-Status"] == "stale-revalidating"
+    assert throttled_response.headers["X-Cache-Status"] == "stale"
+    assert revalidations == [True]
+
+
+def test_cold_modules_list_waits_for_in_flight_load(
+    client,
+    clean_modules_cache,
+) -> None:
+    import threading
+
+    record = {
+        "name": "Python",
+        "versions": ["3.11"],
+        "description": "",
+        "category": "Languages",
+    }
+
+    modules_blueprint._module_refresh_lock.acquire()
+
+    def finish_load() -> None:
+        modules_blueprint._store_modules_cache([record])
+        modules_blueprint._module_refresh_lock.release()
+
+    loader = threading.Timer(0.1, finish_load)
+    loader.start()
+    try:
+        response = client.get("/modules/list")
+    finally:
+        loader.join()
+
+    assert response.status_code == 200
+    assert response.get_json()["unique_count"] == 1
+
+
+def test_modules_ready_stream_pushes_cached_list(
+    client,
+    clean_modules_cache,
+) -> None:
+    empty_response = client.get("/modules/ready-stream")
+    assert empty_response.mimetype == "text/event-stream"
+    assert empty_response.data == b"event: empty\ndata: {}\n\n"
+
+    modules_blueprint._store_modules_cache([
+        {
+            "name": "gcc",
+            "versions": ["gcc/12.2.0"],
+            "description": "GNU Compiler Collection",
+            "category": "Compilers/Toolchains",
+        }
+    ])
+    ready_response = client.get("/modules/ready-stream")
+    event_name, data_line = ready_response.data.decode().strip().split("\n")
+
+    assert event_name == "event: ready"
+    payload = json.loads(data_line.removeprefix("data: "))
+    assert payload["unique_count"] == 1
+    assert payload["modules"][0]["name"] == "gcc"
+
+
+def test_module_refresh_reports_in_progress_while_lock_held(client) -> None:
+    with client.session_transaction() as session:
+        session["csrf_token"] = "refresh-token"
+
+    with modules_blueprint._module_refresh_lock:
+        status_response = client.get("/modules/refresh-status")
+        start_response = client.post(
+            "/modules/refresh-start",
+            headers={"X-CSRF-Token": "refresh-token"},
+        )
+        stream_response = client.get(
+            "/modules/refresh-stream?csrf_token=refresh-token"
+        )
+
+    assert status_response.get_json() == {"in_progress": True}
+    assert start_response.status_code == 409
+    assert b"Refresh already in progress" in stream_response.data
+    assert client.get("/modules/refresh-status").get_json() == {
+        "in_progress": False
+    }
+
+
+def test_module_refresh_start_rejects_when_other_worker_holds_flock(
+    client,
+    monkeypatch,
+    tmp_path,
+) -> None:
+    import fcntl
+
+    lock_file = tmp_path / "modules_refresh.lock"
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULE_REFRESH_LOCK_FILE",
+        lock_file,
+    )
+    with client.session_transaction() as session:
+        session["csrf_token"] = "refresh-token"
+
+    with lock_file.open("a", encoding="utf-8") as other_worker:
+        fcntl.flock(other_worker.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        rejected = client.post(
+            "/modules/refresh-start",
+            headers={"X-CSRF-Token": "refresh-token"},
+        )
+
+    accepted = client.post(
+        "/modules/refresh-start",
+        headers={"X-CSRF-Token": "refresh-token"},
+    )
+
+    assert rejected.status_code == 409
+    assert "another worker" in rejected.get_json()["error"]
+    assert accepted.status_code == 200
+
+
+def test_module_refresh_stream_stores_streamed_modules(
+    client,
+    monkeypatch,
+    tmp_path,
+    clean_modules_cache,
+) -> None:
+    spider_file = tmp_path / "spiderT.lua"
+    spider_file.write_text(
+        'spiderT = {\n'
+        '  ["/apps"] = {\n'
+        '    zlib = { fileT = { ["zlib/1.3"] = { whatis = {"Compression"} } } },\n'
+        '    Bowtie = { fileT = { ["Bowtie/2.5"] = { whatis = {"Aligner"} } } },\n'
+        '  },\n'
+        '}\n',
+        encoding="utf-8",
+    )
+    categories_file = tmp_path / "module_categories.json"
+    categories_file.write_text("{}", encoding="utf-8")
+    monkeypatch.setenv(modules_blueprint.SPIDER_CACHE_ENV_VAR, str(spider_file))
+    monkeypatch.setattr(modules_blueprint, "CATEGORIES_FILE", categories_file)
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULES_SNAPSHOT_FILE",
+        tmp_path / "snapshot.pickle",
+    )
+    monkeypatch.setattr(
+        modules_blueprint,
+        "MODULE_REFRESH_LOCK_FILE",
+        tmp_path / "refresh.lock",
+    )
+    monkeypatch.setattr(modules_blueprint, "_categories_file_cache", None)
+
+    with client.session_transaction() as session:
+        session["csrf_token"] = "refresh-token"
+
+    response = client.get("/modules/refresh-stream?csrf_token=refresh-token")
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+
+    assert [e["module"]["name"] for e in events if e["type"] == "module"] == [
+        "Bowtie",
+        "zlib",
+    ]
+    assert events[-1]["type"] == "complete"
+    assert client.get("/modules/list").get_json()["unique_count"] == 2
+
+
 def test_settings_save_with_csrf_updates_settings_file(
     client,
     monkeypatch,
@@ -165,4 +482,42 @@ def test_projects_status_returns_json(
     assert response.status_code == 200
     assert payload["projects"] == []
     assert payload["total"] == 0
-    mock_collect.assert_called_once_with([str(project_root)], use_cache=True)
+    mock_collect.assert_called_once_with(
+        [str(project_root)],
+        use_cache=True,
+        reuse_repo_results=False,
+    )
+
+
+@patch(
+    "blueprints.projects._collect_projects_data",
+    return_value=(
+        [{
+            "path": "/projects/demo",
+            "name": "demo",
+            "cache_key": ["abc123", "", 1.0],
+            "scanned_at": 1700000000.0,
+        }],
+        None,
+    ),
+)
+def test_projects_status_omits_cache_bookkeeping(
+    _mock_collect,
+    client,
+    monkeypatch,
+    tmp_path,
+) -> None:
+    project_root = tmp_path / "projects"
+    project_root.mkdir()
+    monkeypatch.setenv("OOD_HPC_DASH_PROJECT_ROOTS", str(tmp_path))
+    monkeypatch.setattr(
+        "blueprints.projects.load_settings",
+        lambda: {"project_directories": [str(project_root)]},
+    )
+
+    payload = client.get("/projects/status").get_json()
+
+    assert payload["total"] == 1
+    assert payload["projects"][0]["name"] == "demo"
+    assert "cache_key" not in payload["projects"][0]
+    assert "scanned_at" not in payload["projects"][0]
@@ -5,12 +5,20 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
 from utils import (
     CustomJsonEncoder,
     CustomJsonProvider,
+    atomic_write_bytes,
     expand_path,
     find_binary,
+    json_dumps_bytes,
+    json_loads,
     load_settings,
+    read_file_bytes,
+    read_file_text,
+    save_settings,
     validate_code_editor_path,
     validate_project_directory,
 )
@@ -50,6 +58,45 @@ def test_load_settings_merges_file_with_defaults(
     assert "project_directories" in settings
 
 
+def test_load_settings_returns_defaults_without_file(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    settings = load_settings()
+
+    assert settings["navbar_color"] == "#ede7f6"
+    assert settings["conda_envs_paths"] == ["$HOME/.conda/envs"]
+
+
+def test_load_settings_reparses_only_after_file_changes(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    import utils
+
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text(
+        json.dumps({"navbar_color": "#e3f2fd"}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(utils, "SETTINGS_FILE", settings_file)
+    utils._read_settings_file.cache_clear()
+
+    assert load_settings()["navbar_color"] == "#e3f2fd"
+    assert load_settings()["navbar_color"] == "#e3f2fd"
+    assert utils._read_settings_file.cache_info().misses == 1
+
+    settings_file.write_text(
+        json.dumps({"navbar_color": "#e8f5e9", "extra": True}),
+        encoding="utf-8",
+    )
+
+    assert load_settings()["navbar_color"] == "#e8f5e9"
+    assert utils._read_settings_file.cache_info().misses == 2
+
+
 def test_validate_code_editor_path_requires_allowed_existing_directory(
     tmp_path,
     monkeypatch,
@@ -118,3 +165,105 @@ def test_custom_json_provider_handles_path_and_datetime(app) -> None:
 
     assert '"/tmp/example"' in encoded
     assert "2024-01-01T12:00:00" in encoded
+
+
+def test_custom_json_provider_response_matches_stdlib_jsonify(
+    app,
+    monkeypatch,
+) -> None:
+    from datetime import datetime
+
+    import utils
+
+    payload = {
+        "total": 2,
+        "path": Path("/tmp/example"),
+        "created": datetime(2024, 1, 1, 12, 0, 0),
+        "by_id": {1: "first"},
+    }
+    with app.app_context():
+        fast = app.json.response(payload)
+        fast_args = app.json.response(1, "two")
+        fast_kwargs = app.json.response(total=2)
+        fast_empty = app.json.response()
+        with pytest.raises(TypeError):
+            app.json.response(1, total=2)
+        monkeypatch.setattr(utils, "orjson", None)
+        stdlib = app.json.response(payload)
+
+    assert fast.mimetype == "application/json"
+    assert fast.data.endswith(b"\n")
+    assert json.loads(fast.data) == json.loads(stdlib.data)
+    assert json.loads(fast_args.data) == [1, "two"]
+    assert json.loads(fast_kwargs.data) == {"total": 2}
+    assert json.loads(fast_empty.data) is None
+
+
+def test_json_bytes_helpers_round_trip_with_custom_types() -> None:
+    from datetime import datetime
+
+    encoded = json_dumps_bytes({
+        "path": Path("/tmp/example"),
+        "created": datetime(2024, 1, 1, 12, 0, 0),
+        "names": ["gcc", "CUDA"],
+    })
+
+    assert isinstance(encoded, bytes)
+    decoded = json_loads(encoded)
+    assert decoded["path"] == "/tmp/example"
+    assert decoded["created"].startswith("2024-01-01T12:00:00")
+    assert decoded["names"] == ["gcc", "CUDA"]
+
+
+def test_atomic_write_bytes_replaces_file_without_leftovers(tmp_path) -> None:
+    target = tmp_path / "cache.json"
+    target.write_bytes(b'{"old": true}')
+
+    atomic_write_bytes(target, b'{"new": true}')
+
+    assert target.read_bytes() == b'{"new": true}'
+    assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_save_settings_keeps_old_file_when_encoding_fails(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    import utils
+
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text('{"navbar_color": "#ffffff"}', encoding="utf-8")
+    monkeypatch.setattr(utils, "SETTINGS_FILE", settings_file)
+
+    assert save_settings({"navbar_color": object()}) is False
+    assert settings_file.read_text(encoding="utf-8") == (
+        '{"navbar_color": "#ffffff"}'
+    )
+
+    assert save_settings({"navbar_color": "#000000"}) is True
+    assert json.loads(settings_file.read_text(encoding="utf-8")) == {
+        "navbar_color": "#000000"
+    }
+    assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_read_file_bytes_reads_whole_file(tmp_path) -> None:
+    target = tmp_path / "spiderT.lua"
+    payload = b"spiderT = {}\n" * 50000
+    target.write_bytes(payload)
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+
+    assert read_file_bytes(target) == payload
+    assert read_file_bytes(empty) == b""
+
+
+def test_read_file_text_decodes_with_replacement(tmp_path) -> None:
+    target = tmp_path / "spiderT.lua"
+    target.write_bytes("whatis = 'caf\u00e9'\n".encode("utf-8") + b"\xff")
+    empty = tmp_path / "empty.lua"
+    empty.write_bytes(b"")
+
+    assert read_file_text(target) == "whatis = 'caf\u00e9'\n\ufffd"
+    assert read_file_text(empty) == ""
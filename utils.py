@@ -1,13 +1,21 @@
 """Shared utility functions for the HPC Dashboard application."""
+import functools
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from flask import Response, current_app
 from flask.json.provider import DefaultJSONProvider
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is always available
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 SETTINGS_FILE = Path('config/settings.json')
@@ -24,6 +32,29 @@ def _json_default(obj: Any) -> str:
     )
 
 
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON, using orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(
+        obj,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text or bytes, using orjson if installed.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CustomJsonEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle Path and datetime objects."""
 
@@ -35,11 +66,41 @@ class CustomJsonEncoder(json.JSONEncoder):
 
 
 class CustomJsonProvider(DefaultJSONProvider):
-    """Flask JSON provider for shared dashboard serialization rules."""
+    """Flask JSON provider for shared dashboard serialization rules.
+
+    ``jsonify`` responses are encoded with orjson when it is installed,
+    except when pretty-printing is requested (debug mode or ``compact``).
+    """
 
     def default(self, obj: Any) -> Any:
         return _json_default(obj)
 
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        pretty = (
+            (self.compact is None and current_app.debug)
+            or self.compact is False
+        )
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+
+        # Same argument rules as DefaultJSONProvider.response
+        if args and kwargs:
+            raise TypeError(
+                "app.json.response() takes either args or kwargs, not both"
+            )
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+
+        # Match stdlib jsonify: non-string keys become strings, keys are
+        # sorted when sort_keys is set, and the body ends with a newline
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        body = orjson.dumps(obj, default=_json_default, option=option)
+        return current_app.response_class(body, mimetype=self.mimetype)
+
 
 def _allowed_roots_from_env(
     env_var: str,
@@ -66,8 +127,101 @@ def _allowed_roots_from_env(
     return allowed_roots
 
 
+def read_file_bytes(path: str | Path) -> bytes:
+    """Read a whole file with one open, one fstat, and usually one read.
+
+    Avoids the buffered file object and its extra size-probing reads, which
+    matters for multi-megabyte caches on network filesystems.
+
+    Args:
+        path: File to read
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    file_descriptor = os.open(path, os.O_RDONLY)
+    try:
+        remaining = os.fstat(file_descriptor).st_size
+        chunks: list[bytes] = []
+        while remaining > 0:
+            chunk = os.read(file_descriptor, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(file_descriptor)
+    return b''.join(chunks)
+
+
+def read_file_text(path: str | Path) -> str:
+    """Read and decode a whole UTF-8 file, replacing invalid bytes.
+
+    Reads into memory rather than decoding from a memory map: Lmod may
+    rewrite its spider cache in place, and touching a mapped page past the
+    new end of a truncated file kills the worker with SIGBUS.
+
+    Args:
+        path: File to read
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    return read_file_bytes(path).decode('utf-8', errors='replace')
+
+
+def atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """Replace a file's contents so concurrent readers never see a partial write.
+
+    Data goes to a sibling temp file that is renamed over the target with
+    ``os.replace``. Regenerable caches skip fsync; a crash can lose the new
+    contents but never leaves a truncated file behind.
+
+    Args:
+        path: File to replace
+        data: Complete new file contents
+        durable: fsync the data before the rename (user-edited files)
+
+    Raises:
+        OSError: If the temp file cannot be written or moved into place
+    """
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    file_descriptor = os.open(
+        tmp_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        0o644,
+    )
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(file_descriptor, view):]
+            if durable:
+                os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _read_settings_file(
+    path: str,
+    file_key: tuple[int, int, int, int],
+) -> Any:
+    """Parse the settings file, memoized on its inode, mtime, and size."""
+    return json.loads(read_file_bytes(path))
+
+
 def load_settings() -> dict[str, Any]:
     """Load settings from JSON file with sensible defaults.
+
+    The parsed file is reused until it changes on disk, so nested values
+    are shared between calls and must be treated as read-only.
     
     Returns:
         Dictionary of settings merged with defaults
@@ -82,11 +236,22 @@ def load_settings() -> dict[str, Any]:
         ],
     }
     
+    # Runs on every template render: one stat decides whether the memoized
+    # parse is still current; a missing file just means defaults.
     try:
-        if SETTINGS_FILE.exists():
-            with SETTINGS_FILE.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-            return {**defaults, **data}
+        stat_result = os.stat(SETTINGS_FILE)
+        data = _read_settings_file(
+            os.fspath(SETTINGS_FILE),
+            (
+                stat_result.st_dev,
+                stat_result.st_ino,
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            ),
+        )
+        return {**defaults, **data}
+    except FileNotFoundError:
+        pass
     except (OSError, json.JSONDecodeError, TypeError) as e:
         logger.warning(f"Error loading settings: {e}")
     
@@ -104,8 +269,11 @@ def save_settings(settings: dict[str, Any]) -> bool:
     """
     try:
         SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with SETTINGS_FILE.open('w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
+        atomic_write_bytes(
+            SETTINGS_FILE,
+            json.dumps(settings, indent=4, ensure_ascii=False).encode('utf-8'),
+            durable=True,
+        )
         return True
     except (OSError, TypeError) as e:
         logger.error(f"Error saving settings: {e}")